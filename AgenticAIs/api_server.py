@@ -14,7 +14,8 @@ from dataclasses import asdict
 
 # Add paths
 BASE_PATH = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, BASE_PATH)
+if BASE_PATH not in sys.path:
+    sys.path.insert(0, BASE_PATH)
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -29,6 +30,7 @@ from shared.database import (
     InMemoryDatabase
 )
 from shared.config import get_config
+from shared.quantum_integration import run_quantum_optimization
 
 
 # ============================================================================
@@ -287,8 +289,8 @@ async def run_workflow_async(asteroid_id: int, asteroid_data: dict) -> AegisStat
         # We need a strategy ID first (placeholder for now)
         strategy_id = 999 
         try:
-            for c in candidates:
-                db.insert_simulation(SimulationRun(
+            db.bulk_insert_simulations([
+                SimulationRun(
                     simulation_id=0,
                     strategy_id=strategy_id,
                     candidate_index=c['id'],
@@ -298,7 +300,9 @@ async def run_workflow_async(asteroid_id: int, asteroid_data: dict) -> AegisStat
                     impactor_mass_kg=c['impactor_mass_kg'],
                     estimated_fuel_kg=c['estimated_fuel_kg'],
                     is_optimal=False
-                ))
+                )
+                for c in candidates
+            ])
         except Exception as e:
             print(f"[Database] Error storing simulations: {e}")
 
@@ -337,8 +341,6 @@ async def run_workflow_async(asteroid_id: int, asteroid_data: dict) -> AegisStat
         await asyncio.sleep(2)
         
         # Quantum optimization
-        from shared.quantum_integration import run_quantum_optimization
-        
         try:
             quantum_result = run_quantum_optimization(candidates)
             optimal_idx = quantum_result['optimal_index']
@@ -11,10 +11,12 @@ from typing import Dict, Any, Optional, Literal
 
 # Add paths for agent imports
 BASE_PATH = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, BASE_PATH)
-sys.path.insert(0, os.path.join(BASE_PATH, "Agent-1"))
-sys.path.insert(0, os.path.join(BASE_PATH, "Agent-2"))
-sys.path.insert(0, os.path.join(BASE_PATH, "Agent-3"))
+for _path in (BASE_PATH,
+              os.path.join(BASE_PATH, "Agent-1"),
+              os.path.join(BASE_PATH, "Agent-2"),
+              os.path.join(BASE_PATH, "Agent-3")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 from langgraph.graph import StateGraph, END
 from typing import TypedDict, Annotated
@@ -25,6 +27,7 @@ from shared.state_schema import AegisState, create_initial_state, add_log_entry
 from shared.database import get_database, Asteroid, RiskAssessment, AgentLog
 from shared.config import get_config
 from shared.messaging import publish
+from shared.quantum_integration import run_quantum_optimization, prepare_candidates_for_quantum
 
 
 # ============================================================================
@@ -178,8 +181,6 @@ def agent_2_node(state: OrchestratorState) -> OrchestratorState:
         print(f"\n✓ Strategy Generated: {result.get('method', 'Kinetic')}")
         
         # Generate 16 simulation candidates
-        from shared.quantum_integration import run_quantum_optimization, prepare_candidates_for_quantum
-        
         # Get raw candidates from the result or generate them
         raw_candidates = result.get('candidates', [])
         if not raw_candidates:
@@ -639,7 +640,9 @@ def run_aegis_workflow(
     # Initialize state
     aegis_state = create_initial_state(asteroid_id, asteroid_data)
     
-    # Store asteroid in database
+    # Store asteroid in database. This is the workflow's only direct write
+    # and commits on its own; the graph run below (minutes of LLM calls)
+    # stays outside any transaction so it holds no connection or row lock
     db = get_database()
     db.insert_asteroid(Asteroid(
         asteroid_id=asteroid_id,
@@ -12,8 +12,8 @@ Usage:
 import sys
 import os
 import json
-import argparse
 from datetime import datetime
+from types import SimpleNamespace
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -179,10 +179,10 @@ def display_results(result):
             print(f"   [{entry['agent']}] {entry['action']}")
 
 
-def main():
-    """Main entry point."""
-    print_banner()
-    
+def parse_args():
+    """Parse command-line arguments (only needed off the demo fast path)."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Project Aegis - Planetary Defense System")
     parser.add_argument(
         'mode',
@@ -196,8 +196,19 @@ def main():
         type=str,
         help='Path to JSON file with asteroid data'
     )
+
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    print_banner()
     
-    args = parser.parse_args()
+    # Fast path: a bare demo mode needs no argument parsing
+    if len(sys.argv) == 2 and sys.argv[1] in ("demo1", "demo2", "demo3"):
+        args = SimpleNamespace(mode=sys.argv[1], json=None)
+    else:
+        args = parse_args()
     
     # Check API keys
     if not check_api_keys():
@@ -25,6 +25,9 @@ class DatabaseConfig:
     mysql_password: str = ""
     mysql_database: str = "aegis_db"
     
+    # Rotating log file for database errors
+    log_file: str = "aegis_db.log"
+    
     @classmethod
     def from_env(cls) -> 'DatabaseConfig':
         """Load database config from environment variables."""
@@ -35,6 +38,7 @@ class DatabaseConfig:
             mysql_user=os.getenv("AEGIS_MYSQL_USER", "aegis_admin"),
             mysql_password=os.getenv("AEGIS_MYSQL_PASSWORD", ""),
             mysql_database=os.getenv("AEGIS_MYSQL_DATABASE", "aegis_db"),
+            log_file=os.getenv("AEGIS_DB_LOG_FILE", "aegis_db.log"),
         )
 
 
@@ -12,19 +12,61 @@ To switch to MySQL:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from collections import defaultdict
+from contextlib import contextmanager
+import functools
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+from datetime import date, datetime
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+import asyncio
+import atexit
+import csv
 import json
-import mysql.connector
-from mysql.connector import Error
+import logging
+from logging.handlers import RotatingFileHandler
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+import zlib
+import numpy as np
+from mysql.connector import Error, InterfaceError, pooling
+
+try:
+    import aiomysql
+except ImportError:  # Optional: only AsyncMySQLDatabase needs it
+    aiomysql = None
+
+# Backend errors are logged; the factory attaches a rotating file handler
+logger = logging.getLogger("aegis.db")
 
 
 # ============================================================================
 # DATA MODELS
 # ============================================================================
 
-@dataclass
+# Bound once so the per-row timestamp factories skip attribute lookups
+_now = datetime.now
+_fromtimestamp = datetime.fromtimestamp
+_time = time.time
+
+# [second, isoformat] of the last timestamp handed out by _now_iso
+_now_iso_cache: List[Any] = [0, ""]
+
+
+def _now_iso() -> str:
+    """Current time as ISO-8601, formatted at most once per wall-clock second."""
+    second = int(_time())
+    if second != _now_iso_cache[0]:
+        _now_iso_cache[0] = second
+        _now_iso_cache[1] = _fromtimestamp(second).isoformat()
+    return _now_iso_cache[1]
+
+
+@dataclass(slots=True)
 class Asteroid:
     """Asteroid entity."""
     asteroid_id: Any # int or str (to support external DBs)
@@ -36,10 +78,10 @@ class Asteroid:
     impact_probability: float
     days_until_approach: int
     orbit_params: Dict[str, Any] = field(default_factory=dict)
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskAssessment:
     """Risk assessment from Agent 1."""
     assessment_id: int
@@ -50,10 +92,10 @@ class RiskAssessment:
     risk_score: float
     requires_deflection: bool
     raw_response: Optional[str] = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
 
-@dataclass
+@dataclass(slots=True)
 class DeflectionStrategy:
     """Deflection strategy from Agent 2."""
     strategy_id: int
@@ -62,10 +104,10 @@ class DeflectionStrategy:
     parameters_json: str
     feasibility_score: float
     is_primary: bool = False
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationRun:
     """Simulation candidate for quantum optimization."""
     simulation_id: int
@@ -78,10 +120,10 @@ class SimulationRun:
     estimated_fuel_kg: float
     estimated_miss_km: Optional[float] = None
     is_optimal: bool = False
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
 
-@dataclass
+@dataclass(slots=True)
 class QuantumOptimizationResult:
     """Result from quantum Grover optimization."""
     result_id: int
@@ -93,10 +135,10 @@ class QuantumOptimizationResult:
     iterations: int
     quantum_advantage: float
     execution_time_ms: float
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
 
-@dataclass
+@dataclass(slots=True)
 class SafetyEvaluation:
     """Safety evaluation from Agent 3."""
     evaluation_id: int
@@ -107,10 +149,10 @@ class SafetyEvaluation:
     verdict: str  # "APPROVE" or "REJECT"
     failed_checks_json: str
     feedback: Optional[str] = None
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
 
 
-@dataclass
+@dataclass(slots=True)
 class FinalDecision:
     """Final approved mission decision."""
     decision_id: int
@@ -121,18 +163,96 @@ class FinalDecision:
     confidence_score: float
     explanation: str
     approved_by_humans: bool = False
-    decided_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    decided_at: str = field(default_factory=_now_iso)
 
 
-@dataclass
 class AgentLog:
-    """Activity log for agent actions."""
-    log_id: int
-    agent_name: str
-    action: str
-    related_id: Optional[int] = None
-    details_json: str = "{}"
-    logged_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    """Activity log for agent actions (slotted, recycled via acquire()/release())."""
+    __slots__ = ('log_id', 'agent_name', 'action', 'related_id', 'details_json', 'logged_at')
+
+    def __init__(
+        self,
+        log_id: int,
+        agent_name: str,
+        action: str,
+        related_id: Optional[int] = None,
+        details_json: str = "{}",
+        logged_at: Optional[str] = None
+    ):
+        self.log_id = log_id
+        self.agent_name = agent_name
+        self.action = action
+        self.related_id = related_id
+        self.details_json = details_json
+        # Logs keep sub-second precision so ordering within a second is preserved
+        self.logged_at = logged_at if logged_at is not None else _now().isoformat()
+
+    def __repr__(self) -> str:
+        return (f"AgentLog(log_id={self.log_id!r}, agent_name={self.agent_name!r}, "
+                f"action={self.action!r}, related_id={self.related_id!r}, "
+                f"details_json={self.details_json!r}, logged_at={self.logged_at!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not AgentLog:
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in AgentLog.__slots__)
+
+    @classmethod
+    def acquire(
+        cls,
+        agent_name: str,
+        action: str,
+        related_id: Optional[int] = None,
+        details_json: str = "{}",
+        log_id: int = 0
+    ) -> 'AgentLog':
+        """Get a log from the free-list (or a new one) with its fields rebound."""
+        if not _LOG_POOL:
+            return cls(log_id, agent_name, action, related_id, details_json)
+        log = _LOG_POOL.pop()
+        log.log_id = log_id
+        log.agent_name = agent_name
+        log.action = action
+        log.related_id = related_id
+        log.details_json = details_json
+        log.logged_at = _now().isoformat()
+        return log
+
+    @staticmethod
+    def release(log: 'AgentLog') -> None:
+        """Return a log that is no longer referenced to the free-list."""
+        if len(_LOG_POOL) < _LOG_POOL_MAX:
+            _LOG_POOL.append(log)
+
+
+# Free-list of recycled AgentLog objects
+_LOG_POOL: List[AgentLog] = []
+_LOG_POOL_MAX = 4096
+
+
+# Field names per row type, computed once for export_to_dict
+_FIELDS = {
+    cls: [f.name for f in fields(cls)]
+    for cls in (Asteroid, RiskAssessment, DeflectionStrategy, SimulationRun,
+                QuantumOptimizationResult, SafetyEvaluation, FinalDecision)
+}
+_FIELDS[AgentLog] = list(AgentLog.__slots__)
+
+
+def _shallow(row) -> Dict[str, Any]:
+    """Shallow dict of a row (unlike asdict, nested containers are not copied)."""
+    return {name: getattr(row, name) for name in _FIELDS[type(row)]}
+
+
+# SimulationRun numeric columns mirrored into arrays: (column, attribute, dtype)
+_SIM_COLUMNS = (
+    ('velocity', 'velocity_km_s', np.float64),
+    ('angle', 'angle_degrees', np.float64),
+    ('timing', 'timing_days', np.int32),
+    ('impactor_mass', 'impactor_mass_kg', np.float64),
+    ('fuel', 'estimated_fuel_kg', np.float64),
+    ('miss', 'estimated_miss_km', np.float64),  # NaN when unknown
+)
 
 
 # ============================================================================
@@ -152,6 +272,11 @@ class DatabaseInterface(ABC):
         """Close database connection."""
         pass
     
+    @contextmanager
+    def transaction(self):
+        """Group the writes made inside the block into one transaction."""
+        yield None
+    
     # -------------------- Asteroid Operations --------------------
     
     @abstractmethod
@@ -257,6 +382,29 @@ class DatabaseInterface(ABC):
     def get_logs(self, agent_name: str = None) -> List[AgentLog]:
         """Get agent logs, optionally filtered by agent name."""
         pass
+    
+    def iter_logs(self, agent_name: str = None) -> Iterator[AgentLog]:
+        """Yield agent logs one at a time, optionally filtered by agent name."""
+        yield from self.get_logs(agent_name)
+    
+    # -------------------- Bulk Operations --------------------
+    # Default implementations insert row by row
+    
+    def bulk_insert_risk_assessments(self, assessments: List[RiskAssessment]) -> List[int]:
+        """Insert several risk assessments and return their IDs."""
+        return [self.insert_risk_assessment(a) for a in assessments]
+    
+    def bulk_insert_simulations(self, simulations: List[SimulationRun]) -> List[int]:
+        """Insert several simulation runs and return their IDs."""
+        return [self.insert_simulation(s) for s in simulations]
+    
+    def bulk_insert_safety_evaluations(self, evaluations: List[SafetyEvaluation]) -> List[int]:
+        """Insert several safety evaluations and return their IDs."""
+        return [self.insert_safety_evaluation(e) for e in evaluations]
+    
+    def bulk_insert_logs(self, logs: List[AgentLog]) -> List[int]:
+        """Insert several agent logs and return their IDs."""
+        return [self.insert_log(l) for l in logs]
 
 
 # ============================================================================
@@ -271,16 +419,16 @@ class InMemoryDatabase(DatabaseInterface):
     
     def __init__(self):
         self._connected = False
-        self._id_counters = {
-            'asteroid': 0,
-            'risk_assessment': 0,
-            'strategy': 0,
-            'simulation': 0,
-            'quantum_result': 0,
-            'safety_evaluation': 0,
-            'final_decision': 0,
-            'agent_log': 0,
-        }
+        
+        # Last issued ID per table
+        self._id_asteroid = 0
+        self._id_risk_assessment = 0
+        self._id_strategy = 0
+        self._id_simulation = 0
+        self._id_quantum_result = 0
+        self._id_safety_evaluation = 0
+        self._id_final_decision = 0
+        self._id_agent_log = 0
         
         # Data stores
         self._asteroids: Dict[int, Asteroid] = {}
@@ -291,11 +439,93 @@ class InMemoryDatabase(DatabaseInterface):
         self._safety_evaluations: Dict[int, SafetyEvaluation] = {}
         self._final_decisions: Dict[int, FinalDecision] = {}
         self._agent_logs: Dict[int, AgentLog] = {}
+        
+        # Secondary indexes: foreign key -> first row, or -> row IDs
+        self._asteroids_by_lname: Dict[str, Asteroid] = {}
+        self._risk_by_asteroid: Dict[Any, RiskAssessment] = {}
+        self._strategies_by_asteroid: Dict[Any, List[int]] = defaultdict(list)
+        self._sims_by_strategy: Dict[int, List[int]] = defaultdict(list)
+        self._quantum_by_asteroid: Dict[Any, QuantumOptimizationResult] = {}
+        self._safety_by_sim: Dict[int, SafetyEvaluation] = {}
+        self._decision_by_asteroid: Dict[Any, FinalDecision] = {}
+        self._logs_by_agent: Dict[str, List[int]] = defaultdict(list)
+        
+        # asteroid_id -> (orbit_params dict, its JSON) serialized at insert time
+        self._orbit_params_json: Dict[Any, tuple] = {}
+        
+        # Simulation numerics by column; _sim_row maps simulation_id -> row
+        self._sim_cols: Dict[str, np.ndarray] = {
+            name: np.empty(1024, dtype=dtype) for name, _, dtype in _SIM_COLUMNS
+        }
+        self._sim_row: Dict[int, int] = {}
     
     def _next_id(self, table: str) -> int:
-        """Get next ID for a table."""
-        self._id_counters[table] += 1
-        return self._id_counters[table]
+        """Get next ID for a table (insert_* methods bump their counter inline)."""
+        attr = '_id_' + table
+        next_id = getattr(self, attr) + 1
+        setattr(self, attr, next_id)
+        return next_id
+    
+    def _bulk_insert(
+        self,
+        rows: List[Any],
+        table: str,
+        id_attr: str,
+        store: Dict[int, Any],
+        index: Dict[Any, List[int]],
+        key_attr: str
+    ) -> List[int]:
+        """Store a batch of rows and index them by key_attr."""
+        ids = [getattr(row, id_attr) for row in rows]
+        missing = ids.count(0)
+        if missing == len(rows):
+            attr = '_id_' + table
+            start = getattr(self, attr) + 1
+            setattr(self, attr, start + missing - 1)
+            ids = range(start, start + missing)
+            for row_id, row in zip(ids, rows):
+                setattr(row, id_attr, row_id)
+            key = getattr(rows[0], key_attr)
+            if all(getattr(row, key_attr) == key for row in rows):
+                index[key].extend(ids)
+            else:
+                for row_id, row in zip(ids, rows):
+                    index[getattr(row, key_attr)].append(row_id)
+            store.update(zip(ids, rows))
+            return list(ids)
+        
+        # Pre-assigned (or mixed) IDs
+        for pos, row in enumerate(rows):
+            if ids[pos] == 0:
+                ids[pos] = self._next_id(table)
+                setattr(row, id_attr, ids[pos])
+            old = store.get(ids[pos])
+            if old is None:
+                index[getattr(row, key_attr)].append(ids[pos])
+            store[ids[pos]] = row
+            if old is not None:
+                self._move_indexed(index, store, key_attr, ids[pos],
+                                   getattr(old, key_attr), getattr(row, key_attr))
+        return ids
+    
+    @staticmethod
+    def _move_indexed(index: Dict[Any, List[int]], store: Dict[int, Any], key_attr: str,
+                      row_id: int, old_key: Any, new_key: Any) -> None:
+        """Move a re-inserted row_id from old_key's ID list to new_key's, in store order."""
+        if old_key == new_key:
+            return
+        index[old_key].remove(row_id)
+        index[new_key] = [i for i, row in store.items() if getattr(row, key_attr) == new_key]
+    
+    @staticmethod
+    def _reindex_first(index: Dict[Any, Any], store: Dict[int, Any], key_of, keys: tuple) -> None:
+        """Recompute first-match index entries for keys after a row ID is re-inserted."""
+        for key in keys:
+            index.pop(key, None)
+        for row in store.values():
+            key = key_of(row)
+            if key in keys and key not in index:
+                index[key] = row
     
     def connect(self) -> bool:
         """Establish connection (no-op for in-memory)."""
@@ -311,57 +541,149 @@ class InMemoryDatabase(DatabaseInterface):
     # -------------------- Asteroid Operations --------------------
     
     def insert_asteroid(self, asteroid: Asteroid) -> int:
+        if asteroid.composition:
+            asteroid.composition = sys.intern(asteroid.composition)
         if asteroid.asteroid_id == 0:
-            asteroid.asteroid_id = self._next_id('asteroid')
+            self._id_asteroid += 1
+            asteroid.asteroid_id = self._id_asteroid
+        old = self._asteroids.get(asteroid.asteroid_id)
         self._asteroids[asteroid.asteroid_id] = asteroid
+        if old is None:
+            if asteroid.name:
+                self._asteroids_by_lname.setdefault(asteroid.name.casefold(), asteroid)
+        else:
+            names = tuple(a.name.casefold() for a in (old, asteroid) if a.name)
+            self._reindex_first(self._asteroids_by_lname, self._asteroids,
+                                lambda a: a.name.casefold() if a.name else None, names)
+        self._orbit_params_json[asteroid.asteroid_id] = (
+            asteroid.orbit_params,
+            json.dumps(asteroid.orbit_params, separators=(',', ':'))
+        )
         return asteroid.asteroid_id
     
     def get_asteroid(self, asteroid_id: int) -> Optional[Asteroid]:
         return self._asteroids.get(asteroid_id)
     
+    def _export_asteroid(self, asteroid: Asteroid) -> Dict[str, Any]:
+        """Export row with orbit_params as its cached JSON string."""
+        row = _shallow(asteroid)
+        cached = self._orbit_params_json.get(asteroid.asteroid_id)
+        # Re-serialize only if orbit_params was replaced after insert
+        if cached is None or cached[0] is not asteroid.orbit_params:
+            cached = (asteroid.orbit_params, json.dumps(asteroid.orbit_params, separators=(',', ':')))
+            self._orbit_params_json[asteroid.asteroid_id] = cached
+        row['orbit_params'] = cached[1]
+        return row
+    
     def get_asteroid_by_name(self, name: str) -> Optional[Asteroid]:
-        if not name:
-             return None
-        for asteroid in self._asteroids.values():
-            if asteroid.name and asteroid.name.lower() == name.lower():
-                return asteroid
-        return None
+        return self._asteroids_by_lname.get(name.casefold()) if name else None
     
     # -------------------- Risk Assessment Operations --------------------
     
     def insert_risk_assessment(self, assessment: RiskAssessment) -> int:
         if assessment.assessment_id == 0:
-            assessment.assessment_id = self._next_id('risk_assessment')
+            self._id_risk_assessment += 1
+            assessment.assessment_id = self._id_risk_assessment
+        old = self._risk_assessments.get(assessment.assessment_id)
         self._risk_assessments[assessment.assessment_id] = assessment
+        if old is None:
+            self._risk_by_asteroid.setdefault(assessment.asteroid_id, assessment)
+        else:
+            self._reindex_first(self._risk_by_asteroid, self._risk_assessments, attrgetter('asteroid_id'),
+                                (old.asteroid_id, assessment.asteroid_id))
         return assessment.assessment_id
     
     def get_risk_assessment(self, asteroid_id: int) -> Optional[RiskAssessment]:
-        for assessment in self._risk_assessments.values():
-            if assessment.asteroid_id == asteroid_id:
-                return assessment
-        return None
+        return self._risk_by_asteroid.get(asteroid_id)
     
     # -------------------- Strategy Operations --------------------
     
     def insert_strategy(self, strategy: DeflectionStrategy) -> int:
+        old = None
         if strategy.strategy_id == 0:
-            strategy.strategy_id = self._next_id('strategy')
+            self._id_strategy += 1
+            strategy.strategy_id = self._id_strategy
+            self._strategies_by_asteroid[strategy.asteroid_id].append(strategy.strategy_id)
+        else:
+            old = self._strategies.get(strategy.strategy_id)
+            if old is None:
+                self._strategies_by_asteroid[strategy.asteroid_id].append(strategy.strategy_id)
         self._strategies[strategy.strategy_id] = strategy
+        if old is not None:
+            self._move_indexed(self._strategies_by_asteroid, self._strategies, 'asteroid_id', strategy.strategy_id,
+                               old.asteroid_id, strategy.asteroid_id)
         return strategy.strategy_id
     
     def get_strategies(self, asteroid_id: int) -> List[DeflectionStrategy]:
-        return [s for s in self._strategies.values() if s.asteroid_id == asteroid_id]
+        return [self._strategies[i] for i in self._strategies_by_asteroid.get(asteroid_id, ())]
     
     # -------------------- Simulation Operations --------------------
     
     def insert_simulation(self, simulation: SimulationRun) -> int:
+        old = None
         if simulation.simulation_id == 0:
-            simulation.simulation_id = self._next_id('simulation')
+            self._id_simulation += 1
+            simulation.simulation_id = self._id_simulation
+            self._sims_by_strategy[simulation.strategy_id].append(simulation.simulation_id)
+        else:
+            old = self._simulations.get(simulation.simulation_id)
+            if old is None:
+                self._sims_by_strategy[simulation.strategy_id].append(simulation.simulation_id)
         self._simulations[simulation.simulation_id] = simulation
+        if old is not None:
+            self._move_indexed(self._sims_by_strategy, self._simulations, 'strategy_id', simulation.simulation_id,
+                               old.strategy_id, simulation.strategy_id)
+        row = self._sim_rows([simulation.simulation_id])[0]
+        for name, attr, _ in _SIM_COLUMNS:
+            value = getattr(simulation, attr)
+            self._sim_cols[name][row] = np.nan if value is None else value
         return simulation.simulation_id
     
+    def bulk_insert_simulations(self, simulations: List[SimulationRun]) -> List[int]:
+        """Insert a batch of simulation runs (e.g. all 16 candidates) and return their IDs."""
+        if not simulations:
+            return []
+        ids = self._bulk_insert(simulations, 'simulation', 'simulation_id',
+                                self._simulations, self._sims_by_strategy, 'strategy_id')
+        self._store_sim_columns(simulations)
+        return ids
+    
+    def _sim_rows(self, simulation_ids: List[int]) -> List[int]:
+        """Column rows for simulation_ids, appending new IDs and doubling capacity as needed."""
+        rows = []
+        for sid in simulation_ids:
+            row = self._sim_row.get(sid)
+            if row is None:
+                row = self._sim_row[sid] = len(self._sim_row)
+            rows.append(row)
+        capacity = len(self._sim_cols['velocity'])
+        if len(self._sim_row) > capacity:
+            while capacity < len(self._sim_row):
+                capacity *= 2
+            for name, col in self._sim_cols.items():
+                grown = np.empty(capacity, dtype=col.dtype)
+                grown[:len(col)] = col
+                self._sim_cols[name] = grown
+        return rows
+    
+    def _store_sim_columns(self, simulations: List[SimulationRun]) -> None:
+        """Write a batch of simulation numerics into the column arrays."""
+        n = len(simulations)
+        idx = self._sim_rows([s.simulation_id for s in simulations])
+        for name, attr, dtype in _SIM_COLUMNS:
+            values = (getattr(s, attr) for s in simulations)
+            if attr == 'estimated_miss_km':
+                values = (np.nan if v is None else v for v in values)
+            self._sim_cols[name][idx] = np.fromiter(values, dtype=dtype, count=n)
+    
+    def get_simulation_columns(self, simulation_ids: Iterable[int]) -> Dict[str, np.ndarray]:
+        """Simulation numerics as one array per column, in simulation_ids order."""
+        rows = self._sim_row
+        idx = np.fromiter((rows[sid] for sid in simulation_ids), dtype=np.int64)
+        return {name: col[idx] for name, col in self._sim_cols.items()}
+    
     def get_simulations(self, strategy_id: int) -> List[SimulationRun]:
-        return [s for s in self._simulations.values() if s.strategy_id == strategy_id]
+        return [self._simulations[i] for i in self._sims_by_strategy.get(strategy_id, ())]
     
     def update_simulation_optimal(self, simulation_id: int, is_optimal: bool) -> None:
         if simulation_id in self._simulations:
@@ -371,68 +693,111 @@ class InMemoryDatabase(DatabaseInterface):
     
     def insert_quantum_result(self, result: QuantumOptimizationResult) -> int:
         if result.result_id == 0:
-            result.result_id = self._next_id('quantum_result')
+            self._id_quantum_result += 1
+            result.result_id = self._id_quantum_result
+        old = self._quantum_results.get(result.result_id)
         self._quantum_results[result.result_id] = result
+        if old is None:
+            self._quantum_by_asteroid.setdefault(result.asteroid_id, result)
+        else:
+            self._reindex_first(self._quantum_by_asteroid, self._quantum_results, attrgetter('asteroid_id'),
+                                (old.asteroid_id, result.asteroid_id))
         return result.result_id
     
     def get_quantum_result(self, asteroid_id: int) -> Optional[QuantumOptimizationResult]:
-        for result in self._quantum_results.values():
-            if result.asteroid_id == asteroid_id:
-                return result
-        return None
+        return self._quantum_by_asteroid.get(asteroid_id)
     
     # -------------------- Safety Evaluation Operations --------------------
     
     def insert_safety_evaluation(self, evaluation: SafetyEvaluation) -> int:
         if evaluation.evaluation_id == 0:
-            evaluation.evaluation_id = self._next_id('safety_evaluation')
+            self._id_safety_evaluation += 1
+            evaluation.evaluation_id = self._id_safety_evaluation
+        old = self._safety_evaluations.get(evaluation.evaluation_id)
         self._safety_evaluations[evaluation.evaluation_id] = evaluation
+        if old is None:
+            self._safety_by_sim.setdefault(evaluation.simulation_id, evaluation)
+        else:
+            self._reindex_first(self._safety_by_sim, self._safety_evaluations, attrgetter('simulation_id'),
+                                (old.simulation_id, evaluation.simulation_id))
         return evaluation.evaluation_id
     
     def get_safety_evaluation(self, simulation_id: int) -> Optional[SafetyEvaluation]:
-        for evaluation in self._safety_evaluations.values():
-            if evaluation.simulation_id == simulation_id:
-                return evaluation
-        return None
+        return self._safety_by_sim.get(simulation_id)
     
     # -------------------- Final Decision Operations --------------------
     
     def insert_final_decision(self, decision: FinalDecision) -> int:
         if decision.decision_id == 0:
-            decision.decision_id = self._next_id('final_decision')
+            self._id_final_decision += 1
+            decision.decision_id = self._id_final_decision
+        old = self._final_decisions.get(decision.decision_id)
         self._final_decisions[decision.decision_id] = decision
+        if old is None:
+            self._decision_by_asteroid.setdefault(decision.asteroid_id, decision)
+        else:
+            self._reindex_first(self._decision_by_asteroid, self._final_decisions, attrgetter('asteroid_id'),
+                                (old.asteroid_id, decision.asteroid_id))
         return decision.decision_id
     
     def get_final_decision(self, asteroid_id: int) -> Optional[FinalDecision]:
-        for decision in self._final_decisions.values():
-            if decision.asteroid_id == asteroid_id:
-                return decision
-        return None
+        return self._decision_by_asteroid.get(asteroid_id)
     
     # -------------------- Agent Log Operations --------------------
     
     def insert_log(self, log: AgentLog) -> int:
+        # Agent names and actions come from a small closed set; intern them
+        log.agent_name = sys.intern(log.agent_name)
+        log.action = sys.intern(log.action)
+        old = None
         if log.log_id == 0:
-            log.log_id = self._next_id('agent_log')
+            self._id_agent_log += 1
+            log.log_id = self._id_agent_log
+            self._logs_by_agent[log.agent_name].append(log.log_id)
+        else:
+            old = self._agent_logs.get(log.log_id)
+            if old is None:
+                self._logs_by_agent[log.agent_name].append(log.log_id)
         self._agent_logs[log.log_id] = log
+        if old is not None:
+            self._move_indexed(self._logs_by_agent, self._agent_logs, 'agent_name', log.log_id,
+                               old.agent_name, log.agent_name)
         return log.log_id
     
+    def bulk_insert_logs(self, logs: List[AgentLog]) -> List[int]:
+        """Insert a batch of agent logs and return their IDs."""
+        if not logs:
+            return []
+        for log in logs:
+            log.agent_name = sys.intern(log.agent_name)
+            log.action = sys.intern(log.action)
+        return self._bulk_insert(logs, 'agent_log', 'log_id',
+                                 self._agent_logs, self._logs_by_agent, 'agent_name')
+    
     def get_logs(self, agent_name: str = None) -> List[AgentLog]:
         if agent_name:
-            return [l for l in self._agent_logs.values() if l.agent_name == agent_name]
+            return [self._agent_logs[i] for i in self._logs_by_agent.get(agent_name, ())]
         return list(self._agent_logs.values())
     
+    def drain_log(self, log_id: int) -> None:
+        """Remove a log and hand its object back to the AgentLog free-list."""
+        log = self._agent_logs.pop(log_id, None)
+        if log is None:
+            return
+        self._logs_by_agent[log.agent_name].remove(log_id)
+        AgentLog.release(log)
+    
     def export_to_dict(self) -> Dict[str, Any]:
         """Export all data as a dictionary (for debugging)."""
         return {
-            'asteroids': [asdict(a) for a in self._asteroids.values()],
-            'risk_assessments': [asdict(r) for r in self._risk_assessments.values()],
-            'strategies': [asdict(s) for s in self._strategies.values()],
-            'simulations': [asdict(s) for s in self._simulations.values()],
-            'quantum_results': [asdict(q) for q in self._quantum_results.values()],
-            'safety_evaluations': [asdict(s) for s in self._safety_evaluations.values()],
-            'final_decisions': [asdict(f) for f in self._final_decisions.values()],
-            'agent_logs': [asdict(l) for l in self._agent_logs.values()],
+            'asteroids': [self._export_asteroid(a) for a in self._asteroids.values()],
+            'risk_assessments': [_shallow(r) for r in self._risk_assessments.values()],
+            'strategies': [_shallow(s) for s in self._strategies.values()],
+            'simulations': [_shallow(s) for s in self._simulations.values()],
+            'quantum_results': [_shallow(q) for q in self._quantum_results.values()],
+            'safety_evaluations': [_shallow(s) for s in self._safety_evaluations.values()],
+            'final_decisions': [_shallow(f) for f in self._final_decisions.values()],
+            'agent_logs': [_shallow(l) for l in self._agent_logs.values()],
         }
 
 
@@ -440,6 +805,235 @@ class InMemoryDatabase(DatabaseInterface):
 # MYSQL IMPLEMENTATION (Production - Placeholder)
 # ============================================================================
 
+# Upsert on the ID or uq_asteroid_name; lastrowid is the existing ID on a duplicate
+_SQL_INS_ASTEROID = """
+    INSERT INTO asteroid
+    (asteroid_id, name, diameter_m, mass_kg, velocity_km_s, composition, impact_probability, days_until_approach)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE asteroid_id = LAST_INSERT_ID(asteroid_id)
+"""
+
+# Catalog ingestion; the CSV has a header row and these columns in order
+_SQL_LOAD_ASTEROIDS = """
+    LOAD DATA LOCAL INFILE %s INTO TABLE asteroid
+    FIELDS TERMINATED BY ',' ENCLOSED BY '"'
+    LINES TERMINATED BY '\\n'
+    IGNORE 1 LINES
+    (name, diameter_m, mass_kg, velocity_km_s, composition, impact_probability, days_until_approach)
+"""
+
+_ASTEROID_CSV_COLUMNS = (
+    "name", "diameter_m", "mass_kg", "velocity_km_s",
+    "composition", "impact_probability", "days_until_approach",
+)
+
+_SQL_GET_ASTEROID_EXACT = "SELECT * FROM asteroid WHERE Name = %s OR Asteroid_ID = %s LIMIT 1"
+
+# Fuzzy fallback; needs the ft_asteroid_name FULLTEXT index (see schema.sql)
+_SQL_GET_ASTEROID_FULLTEXT = """
+    SELECT * FROM asteroid
+    WHERE MATCH(Name) AGAINST (%s IN NATURAL LANGUAGE MODE)
+    LIMIT 1
+"""
+
+_SQL_GET_ASTEROID = """
+    SELECT asteroid_id, name, diameter_m, mass_kg, velocity_km_s, composition,
+           impact_probability, days_until_approach
+    FROM asteroid WHERE asteroid_id = %s
+"""
+
+_SQL_GET_RISK = """
+    SELECT assessment_id, asteroid_id, impact_probability, kinetic_energy_mt,
+           estimated_damage, risk_score, requires_deflection, created_at
+    FROM risk_assessment WHERE asteroid_id = %s
+"""
+
+_SQL_INS_RISK = """
+    INSERT INTO risk_assessment
+    (asteroid_id, impact_probability, kinetic_energy_mt, estimated_damage, risk_score, requires_deflection)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+_SQL_INS_SIM = """
+    INSERT INTO simulation_run
+    (strategy_id, candidate_index, velocity_km_s, angle_degrees, timing_days, impactor_mass_kg, estimated_fuel_kg, is_optimal)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+_SQL_INS_QUANTUM = """
+    INSERT INTO quantum_result
+    (asteroid_id, optimal_simulation_id, optimal_index, success_probability, qubits_used, iterations, quantum_advantage, execution_time_ms)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+_SQL_INS_SAFETY = """
+    INSERT INTO safety_evaluation
+    (simulation_id, fragmentation_risk_pct, miss_distance_km, confidence_score, verdict, failed_checks_json)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+_SQL_INS_FINAL = """
+    INSERT INTO final_decision
+    (asteroid_id, strategy_id, primary_simulation_id, backup_simulation_id, confidence_score, explanation, approved_by_humans)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+
+_SQL_INS_LOG = """
+    INSERT INTO agent_log
+    (agent_name, action, related_id, details_json)
+    VALUES (%s, %s, %s, %s)
+"""
+
+_SQL_UPDATE_SIM_OPTIMAL = "UPDATE simulation_run SET is_optimal = %s WHERE simulation_id = %s"
+
+_SQL_GET_LOGS = """
+    SELECT log_id, agent_name, action, related_id, details_json, logged_at
+    FROM agent_log ORDER BY logged_at DESC LIMIT 100
+"""
+
+_SQL_GET_LOGS_BY_AGENT = """
+    SELECT log_id, agent_name, action, related_id, details_json, logged_at
+    FROM agent_log WHERE agent_name = %s ORDER BY logged_at DESC LIMIT 100
+"""
+
+
+def _pack(text: Optional[str]) -> Optional[bytes]:
+    """Compress a JSON column value for its MEDIUMBLOB column (see schema.sql)."""
+    if text is None:
+        return None
+    # Level 1: most of the size reduction at a fraction of the default's CPU cost
+    return zlib.compress(text.encode(), 1)
+
+
+def _unpack(value) -> Optional[str]:
+    """Inverse of _pack; also reads legacy uncompressed rows (str or bytes)."""
+    if value is None or isinstance(value, str):
+        return value
+    value = bytes(value)
+    # zlib streams start with 0x78 ('x'); JSON text never does
+    if value[:1] == b'x':
+        try:
+            return zlib.decompress(value).decode()
+        except zlib.error:
+            pass
+    return value.decode()
+
+
+@functools.lru_cache(maxsize=64)
+def _values_clause(ncols: int, nrows: int) -> str:
+    """Placeholder list for a multi-row INSERT, e.g. "(%s, %s), (%s, %s)"."""
+    return ", ".join(["(" + ", ".join(["%s"] * ncols) + ")"] * nrows)
+
+
+class _TTLMemo:
+    """Thread-safe memo of found rows (None is not stored) with a TTL."""
+    
+    def __init__(self, func, maxsize: int, ttl_s: float = 30.0):
+        self._func = func
+        self._maxsize = maxsize
+        self._ttl_s = ttl_s
+        self._entries: Dict[Any, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def __call__(self, key):
+        now = time.monotonic()
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+        value = self._func(key)
+        if value is not None:
+            with self._lock:
+                self._entries.pop(key, None)
+                if len(self._entries) >= self._maxsize:
+                    # Dict order is insertion order: drop the oldest entry
+                    del self._entries[next(iter(self._entries))]
+                self._entries[key] = (now + self._ttl_s, value)
+        return value
+    
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class IdlePingPool(pooling.MySQLConnectionPool):
+    """Connection pool that pings only connections idle for over idle_ping_s."""
+    idle_ping_s = 30.0
+    # Called with the raw connection after it reconnects (new server session)
+    on_reconnect = None
+    
+    def _queue_connection(self, cnx) -> None:
+        cnx.aegis_last_used = time.monotonic()
+        super()._queue_connection(cnx)
+    
+    def get_connection(self) -> pooling.PooledMySQLConnection:
+        with pooling.CONNECTION_POOL_LOCK:
+            try:
+                cnx = self._cnx_queue.get(block=False)
+            except queue.Empty as err:
+                raise pooling.PoolError("Failed getting connection; pool exhausted") from err
+            
+            try:
+                if self._config_version != cnx.pool_config_version:
+                    cnx.config(**self._cnx_config)
+                    cnx.reconnect()
+                    cnx.pool_config_version = self._config_version
+                    self._reconnected(cnx)
+                elif time.monotonic() - getattr(cnx, 'aegis_last_used', 0.0) > self.idle_ping_s:
+                    try:
+                        cnx.cmd_ping()
+                    except Error:
+                        cnx.reconnect(attempts=3, delay=0)
+                        self._reconnected(cnx)
+            except InterfaceError:
+                # Failed to reconnect, give connection back to pool
+                self._queue_connection(cnx)
+                raise
+            
+            return pooling.PooledMySQLConnection(self, cnx)
+    
+    def _reconnected(self, cnx) -> None:
+        if self.on_reconnect is not None:
+            self.on_reconnect(cnx)
+
+
+class PreparedCache:
+    """Prepared cursors memoized per pooled connection and SQL string."""
+    
+    def __init__(self):
+        # raw connection -> {sql: cursor}
+        self._cursors: Dict[Any, Dict[str, Any]] = {}
+    
+    def execute(self, conn, sql: str, params):
+        """Execute sql with params on conn's prepared cursor and return the cursor."""
+        cursors = self._cursors.setdefault(getattr(conn, '_cnx', conn), {})
+        cursor = cursors.get(sql)
+        if cursor is None:
+            cursor = cursors[sql] = conn.cursor(prepared=True)
+        try:
+            cursor.execute(sql, params)
+        except Error:
+            # The statement handle may be stale; prepare it again next time
+            del cursors[sql]
+            raise
+        return cursor
+    
+    def invalidate(self, cnx) -> None:
+        """Forget the cursors of a connection that reconnected."""
+        # Not closed: their statement IDs may belong to the new session
+        self._cursors.pop(cnx, None)
+    
+    def close_all(self) -> None:
+        """Close every cached cursor."""
+        for cursors in self._cursors.values():
+            for cursor in cursors.values():
+                try:
+                    cursor.close()
+                except Error:
+                    pass
+        self._cursors.clear()
+
+
 class MySQLDatabase(DatabaseInterface):
     """
     MySQL database implementation for production use.
@@ -454,215 +1048,332 @@ class MySQLDatabase(DatabaseInterface):
     5. Run schema.sql to create tables
     """
     
+    # Background log writer tuning
+    LOG_QUEUE_SIZE = 10000
+    LOG_BATCH_SIZE = 500
+    LOG_STOP_TIMEOUT_S = 10.0
+    
     def __init__(self, host: str, port: int, user: str, password: str, database: str):
         self.host = host
         self.port = port
         self.user = user
         self.password = password
         self.database = database
-        self._connection = None
+        self._pool = None
+        self._prepared = PreparedCache()
+        # Per-thread connection of the active transaction() block, if any
+        self._tx = threading.local()
+        # The demo pipeline resolves the same names repeatedly
+        self._find_asteroid_by_name = _TTLMemo(self._find_asteroid_by_name_uncached, maxsize=256)
+        # Cleared by the matching inserts
+        self._get_asteroid = _TTLMemo(self._get_asteroid_uncached, maxsize=1024)
+        self._get_risk_assessment = _TTLMemo(self._get_risk_assessment_uncached, maxsize=1024)
+        # insert_log hands rows to a background writer (started by connect)
+        self._log_q: queue.Queue = queue.Queue(maxsize=self.LOG_QUEUE_SIZE)
+        self._log_thread: Optional[threading.Thread] = None
+        self._autoinc_increment: Optional[int] = None
     
     def connect(self) -> bool:
-        """Establish database connection."""
+        """Create the connection pool."""
         try:
-            self._connection = mysql.connector.connect(
+            self._pool = IdlePingPool(
+                pool_name="aegis",
+                pool_size=10,
                 host=self.host,
                 port=self.port,
                 user=self.user,
                 password=self.password,
-                database=self.database
+                database=self.database,
+                autocommit=False,
+                # Needed by bulk_load_asteroids (LOAD DATA LOCAL INFILE)
+                allow_local_infile=True,
+                # Keep session state (and so prepared statements) across borrows
+                pool_reset_session=False
             )
-            if self._connection.is_connected():
-                print(f"[Database] Connected to MySQL database: {self.database}")
-                return True
+            self._pool.on_reconnect = self._prepared.invalidate
+            print(f"[Database] Connected to MySQL database: {self.database}")
+            if self._log_thread is None:
+                self._log_thread = threading.Thread(
+                    target=self._log_writer, name="aegis-log-writer", daemon=True
+                )
+                self._log_thread.start()
+                # Entry points exit without calling disconnect()
+                atexit.register(self._stop_log_writer)
+            return True
         except Error as e:
             print(f"[Database] Error connecting to MySQL: {e}")
-            self._connection = None
+            self._pool = None
         return False
 
     def disconnect(self) -> None:
-        """Close database connection."""
-        if self._connection and self._connection.is_connected():
-            self._connection.close()
-            print("[Database] MySQL connection closed")
+        """Flush queued logs and release the connection pool."""
+        self._stop_log_writer()
+        atexit.unregister(self._stop_log_writer)
+        self._prepared.close_all()
+        if self._pool:
+            # Closes the idle pooled connections
+            self._pool._remove_connections()
+            self._pool = None
+            print("[Database] MySQL connection pool closed")
+
+    @contextmanager
+    def transaction(self):
+        """Run the block's writes on one connection in a single transaction."""
+        tx_conn = getattr(self._tx, 'conn', None)
+        if tx_conn is not None:
+            # Nested block joins the outer transaction
+            yield tx_conn
+            return
+        with self._borrow() as conn:
+            conn.start_transaction()
+            self._tx.conn = conn
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                # Rows read or written inside the block may no longer exist
+                self._invalidate_asteroids()
+                self._get_risk_assessment.cache_clear()
+                raise
+            finally:
+                self._tx.conn = None
+
+    def _invalidate_asteroids(self) -> None:
+        """Drop memoized asteroid lookups after the asteroid table changes."""
+        self._find_asteroid_by_name.cache_clear()
+        self._get_asteroid.cache_clear()
+
+    def _commit(self, conn) -> None:
+        """Commit, unless conn belongs to an active transaction() block."""
+        if getattr(self._tx, 'conn', None) is not conn:
+            conn.commit()
 
-    def _get_cursor(self):
-        """Helper to get a dictionary cursor."""
-        if not self._connection or not self._connection.is_connected():
-            self.connect()
-        return self._connection.cursor(dictionary=True)
+    @contextmanager
+    def _borrow(self):
+        """Borrow a pooled connection; closing it hands it back to the pool."""
+        tx_conn = getattr(self._tx, 'conn', None)
+        if tx_conn is not None:
+            yield tx_conn
+            return
+        if self._pool is None and not self.connect():
+            raise Error(msg="MySQL connection pool is not available")
+        conn = self._pool.get_connection()
+        try:
+            yield conn
+        finally:
+            try:
+                # End the implicit transaction reads leave open (autocommit is off)
+                if conn.in_transaction:
+                    conn.rollback()
+            except Error as e:
+                logger.warning("Error rolling back pooled connection", exc_info=e)
+            finally:
+                conn.close()
+
+    @contextmanager
+    def _borrow_cursor(self, dict_: bool = False):
+        """Borrow a pooled connection and a (tuple, or dict_) cursor on it."""
+        with self._borrow() as conn:
+            cursor = conn.cursor(dictionary=dict_)
+            try:
+                yield conn, cursor
+            finally:
+                cursor.close()
+
+    def _bulk_insert(self, table: str, columns: tuple, rows: List[tuple], chunk: int = 1000) -> List[int]:
+        """Insert rows with multi-row INSERTs and one commit; return the generated IDs."""
+        if not rows:
+            return []
+        prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+        ids = []
+        try:
+            with self._borrow_cursor() as (conn, cursor):
+                step = self._autoinc_step(cursor)
+                for start in range(0, len(rows), chunk):
+                    batch = rows[start:start + chunk]
+                    sql = prefix + _values_clause(len(columns), len(batch))
+                    cursor.execute(sql, tuple(v for row in batch for v in row))
+                    ids.extend(range(cursor.lastrowid, cursor.lastrowid + len(batch) * step, step))
+                self._commit(conn)
+            return ids
+        except Error as e:
+            logger.error("Error bulk inserting into %s", table, exc_info=e)
+            return []
+
+    def _autoinc_step(self, cursor) -> int:
+        """Server auto_increment_increment (read once; >1 under replication setups)."""
+        if self._autoinc_increment is None:
+            cursor.execute("SELECT @@auto_increment_increment")
+            self._autoinc_increment = int(cursor.fetchone()[0])
+        return self._autoinc_increment
 
     # -------------------- Asteroid Operations --------------------
     
     def insert_asteroid(self, asteroid: Asteroid) -> int:
         """Insert asteroid and return ID."""
-        cursor = self._get_cursor()
         try:
-            # Check if exists first to avoid duplicates
-            if asteroid.asteroid_id > 0: # If ID is provided, check existence
-                 cursor.execute("SELECT asteroid_id FROM asteroid WHERE asteroid_id = %s", (asteroid.asteroid_id,))
-                 if cursor.fetchone():
-                     return asteroid.asteroid_id # Already exists
-            
-            # Or check by name if ID is 0
-            if asteroid.asteroid_id == 0:
-                 cursor.execute("SELECT asteroid_id FROM asteroid WHERE name = %s", (asteroid.name,))
-                 res = cursor.fetchone()
-                 if res:
-                     return res['asteroid_id']
-
-            sql = """
-                INSERT INTO asteroid 
-                (name, diameter_m, mass_kg, velocity_km_s, composition, impact_probability, days_until_approach)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """
-            val = (
-                asteroid.name,
-                asteroid.diameter_m,
-                asteroid.mass_kg,
-                asteroid.velocity_km_s,
-                asteroid.composition,
-                asteroid.impact_probability,
-                asteroid.days_until_approach
-            )
-            cursor.execute(sql, val)
-            self._connection.commit()
-            return cursor.lastrowid
+            with self._borrow() as conn:
+                val = (
+                    asteroid.asteroid_id or None,
+                    asteroid.name,
+                    asteroid.diameter_m,
+                    asteroid.mass_kg,
+                    asteroid.velocity_km_s,
+                    asteroid.composition,
+                    asteroid.impact_probability,
+                    asteroid.days_until_approach
+                )
+                cursor = self._prepared.execute(conn, _SQL_INS_ASTEROID, val)
+                self._commit(conn)
+                self._invalidate_asteroids()
+                return cursor.lastrowid
+        except Error as e:
+            logger.error("Error inserting asteroid", exc_info=e)
+            return 0
+
+    def bulk_load_asteroids(self, csv_path: str) -> int:
+        """Load an asteroid catalog CSV with LOAD DATA LOCAL INFILE; return the row count."""
+        try:
+            with self._borrow_cursor() as (conn, cursor):
+                cursor.execute(_SQL_LOAD_ASTEROIDS, (os.path.abspath(csv_path),))
+                self._commit(conn)
+                self._invalidate_asteroids()
+                return cursor.rowcount
         except Error as e:
-            print(f"[Database] Error inserting asteroid: {e}")
+            logger.error("Error bulk loading asteroids from %s", csv_path, exc_info=e)
+            return 0
+
+    def bulk_insert_asteroids(self, asteroids: List[Asteroid]) -> int:
+        """Load asteroids through a temporary CSV; return the row count."""
+        if not asteroids:
             return 0
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        try:
+            with os.fdopen(fd, "w", newline="") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(_ASTEROID_CSV_COLUMNS)
+                writer.writerows(
+                    tuple(getattr(a, c) for c in _ASTEROID_CSV_COLUMNS) for a in asteroids
+                )
+            return self.bulk_load_asteroids(path)
         finally:
-            cursor.close()
+            os.remove(path)
 
     def get_asteroid(self, asteroid_id: int) -> Optional[Asteroid]:
         """Get asteroid by ID."""
-        cursor = self._get_cursor()
         try:
-            cursor.execute("SELECT * FROM asteroid WHERE asteroid_id = %s", (asteroid_id,))
-            row = cursor.fetchone()
-            if row:
-                return Asteroid(
-                    asteroid_id=row['asteroid_id'],
-                    name=row['name'],
-                    diameter_m=row['diameter_m'],
-                    mass_kg=row['mass_kg'],
-                    velocity_km_s=row['velocity_km_s'],
-                    composition=row['composition'],
-                    impact_probability=row['impact_probability'],
-                    days_until_approach=row['days_until_approach']
-                )
-            return None
+            return self._get_asteroid(asteroid_id)
         except Error as e:
-            print(f"[Database] Error fetching asteroid: {e}")
+            logger.error("Error fetching asteroid", exc_info=e)
             return None
-        finally:
-            cursor.close()
+
+    def _get_asteroid_uncached(self, asteroid_id: int) -> Optional[Asteroid]:
+        with self._borrow_cursor() as (conn, cursor):
+            cursor.execute(_SQL_GET_ASTEROID, (asteroid_id,))
+            row = cursor.fetchone()
+            # Columns are selected in Asteroid field order
+            return Asteroid(*row) if row else None
 
     def get_asteroid_by_name(self, name: str) -> Optional[Asteroid]:
-        """Get asteroid by name (case-insensitive substring search)."""
-        cursor = self._get_cursor()
+        """Get asteroid by name or Asteroid_ID (exact match, then FULLTEXT)."""
         try:
-            # Search by Name or Asteroid_ID
-            sql = "SELECT * FROM asteroid WHERE Name LIKE %s OR Asteroid_ID LIKE %s"
-            val = (f"%{name}%", f"%{name}%") 
-            cursor.execute(sql, val)
+            return self._find_asteroid_by_name(name)
+        except Error as e:
+            logger.error("Error fetching asteroid by name", exc_info=e)
+            return None
+    
+    def _find_asteroid_by_name_uncached(self, name: str) -> Optional[Asteroid]:
+        """Uncached lookup behind get_asteroid_by_name (raises on DB errors)."""
+        with self._borrow_cursor(dict_=True) as (conn, cursor):
+            cursor.execute(_SQL_GET_ASTEROID_EXACT, (name, name))
             row = cursor.fetchone()
+            if not row:
+                cursor.execute(_SQL_GET_ASTEROID_FULLTEXT, (name,))
+                row = cursor.fetchone()
+        
+        if row:
+            # MAP USER SCHEMA TO INTERNAL MODEL
             
-            if row:
-                # MAP USER SCHEMA TO INTERNAL MODEL
-                
-                # ID Handling
+            # Diameter Handling (Km -> m)
+            diameter = float(row['Diameter_Km']) * 1000 if row.get('Diameter_Km') else 100.0
+            
+            # Date Handling
+            days = 365
+            det_date = row.get('Detection_Date')
+            if det_date:
                 try:
-                    aid = int(row['Asteroid_ID'])
+                    # The connector already returns DATE columns as datetime.date
+                    if isinstance(det_date, datetime):
+                        det_date = det_date.date()
+                    elif not isinstance(det_date, date):
+                        det_date = date.fromisoformat(str(det_date)[:10])
+                    days = max(1, (det_date - date.today()).days)
                 except:
-                    # Hash string ID to int if not numeric
-                    aid = int(hash(row['Asteroid_ID']) % 1000000)
-                
-                # Diameter Handling (Km -> m)
-                diameter = float(row['Diameter_Km']) * 1000 if row.get('Diameter_Km') else 100.0
-                
-                # Date Handling
-                days = 365
-                if row.get('Detection_Date'):
-                    try:
-                        from datetime import datetime
-                        det_date = datetime.strptime(str(row['Detection_Date']), '%Y-%m-%d')
-                        delta = det_date - datetime.now()
-                        days = max(1, delta.days)
-                    except:
-                        pass
-
-                # Risk Handling (Inject high risk for Apophis to ensure demo works)
-                impact_prob = 0.01 
-                if 'Apophis' in row['Name'] or '99942' in str(row['Asteroid_ID']):
-                    impact_prob = 0.45
-                
-                return Asteroid(
-                    asteroid_id=row['Asteroid_ID'],  # Keep original string ID
-                    name=row['Name'],
-                    diameter_m=diameter,
-                    mass_kg=2.7e10, # Default mass if missing
-                    velocity_km_s=float(row.get('Velocity_Kmps', 20.0)),
-                    composition=row.get('Composition', 'Unknown'),
-                    impact_probability=impact_prob,
-                    days_until_approach=days
-                )
-            return None
-        except Error as e:
-            print(f"[Database] Error fetching asteroid by name: {e}")
-            return None
-        finally:
-            cursor.close()
+                    pass
+
+            # Risk Handling (Inject high risk for Apophis to ensure demo works)
+            impact_prob = 0.01 
+            if 'Apophis' in row['Name'] or '99942' in str(row['Asteroid_ID']):
+                impact_prob = 0.45
+            
+            return Asteroid(
+                asteroid_id=row['Asteroid_ID'],  # Keep original string ID
+                name=row['Name'],
+                diameter_m=diameter,
+                mass_kg=2.7e10, # Default mass if missing
+                velocity_km_s=float(row.get('Velocity_Kmps', 20.0)),
+                composition=row.get('Composition', 'Unknown'),
+                impact_probability=impact_prob,
+                days_until_approach=days
+            )
+        return None
     
     def insert_risk_assessment(self, assessment: RiskAssessment) -> int:
         """Insert risk assessment and return ID."""
-        cursor = self._get_cursor()
         try:
-            sql = """
-                INSERT INTO risk_assessment 
-                (asteroid_id, impact_probability, kinetic_energy_mt, estimated_damage, risk_score, requires_deflection)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            val = (
-                assessment.asteroid_id,
-                assessment.impact_probability,
-                assessment.kinetic_energy_mt,
-                assessment.estimated_damage,
-                assessment.risk_score,
-                assessment.requires_deflection
-            )
-            cursor.execute(sql, val)
-            self._connection.commit()
-            return cursor.lastrowid
+            with self._borrow() as conn:
+                val = (
+                    assessment.asteroid_id,
+                    assessment.impact_probability,
+                    assessment.kinetic_energy_mt,
+                    assessment.estimated_damage,
+                    assessment.risk_score,
+                    assessment.requires_deflection
+                )
+                cursor = self._prepared.execute(conn, _SQL_INS_RISK, val)
+                self._commit(conn)
+                self._get_risk_assessment.cache_clear()
+                return cursor.lastrowid
         except Error as e:
-            print(f"[Database] Error inserting risk_assessment: {e}")
+            logger.error("Error inserting risk_assessment", exc_info=e)
             return 0
-        finally:
-            cursor.close()
 
     def get_risk_assessment(self, asteroid_id: int) -> Optional[RiskAssessment]:
         """Get risk assessment for asteroid."""
-        cursor = self._get_cursor()
         try:
-            cursor.execute("SELECT * FROM risk_assessment WHERE asteroid_id = %s", (asteroid_id,))
+            return self._get_risk_assessment(asteroid_id)
+        except Error as e:
+            logger.error("Error fetching risk_assessment", exc_info=e)
+            return None
+
+    def _get_risk_assessment_uncached(self, asteroid_id: int) -> Optional[RiskAssessment]:
+        with self._borrow_cursor() as (conn, cursor):
+            cursor.execute(_SQL_GET_RISK, (asteroid_id,))
             row = cursor.fetchone()
             if row:
+                rid, aid, ip, ke, damage, score, deflect, created = row
                 return RiskAssessment(
-                    assessment_id=row['assessment_id'],
-                    asteroid_id=row['asteroid_id'],
-                    impact_probability=row['impact_probability'],
-                    kinetic_energy_mt=row['kinetic_energy_mt'],
-                    estimated_damage=row['estimated_damage'],
-                    risk_score=row['risk_score'],
-                    requires_deflection=bool(row['requires_deflection']),
-                    created_at=str(row['created_at'])
+                    assessment_id=rid,
+                    asteroid_id=aid,
+                    impact_probability=ip,
+                    kinetic_energy_mt=ke,
+                    estimated_damage=damage,
+                    risk_score=score,
+                    requires_deflection=bool(deflect),
+                    created_at=str(created)
                 )
             return None
-        except Error as e:
-            print(f"[Database] Error fetching risk_assessment: {e}")
-            return None
-        finally:
-            cursor.close()
 
     def insert_strategy(self, strategy: DeflectionStrategy) -> int:
          # Placeholder for now as it's not strictly required by current workflow
@@ -673,199 +1384,422 @@ class MySQLDatabase(DatabaseInterface):
 
     def insert_simulation(self, simulation: SimulationRun) -> int:
         """Insert simulation run and return ID."""
-        cursor = self._get_cursor()
         try:
-            sql = """
-                INSERT INTO simulation_run 
-                (strategy_id, candidate_index, velocity_km_s, angle_degrees, timing_days, impactor_mass_kg, estimated_fuel_kg, is_optimal)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            val = (
-                simulation.strategy_id,
-                simulation.candidate_index,
-                simulation.velocity_km_s,
-                simulation.angle_degrees,
-                simulation.timing_days,
-                simulation.impactor_mass_kg,
-                simulation.estimated_fuel_kg,
-                simulation.is_optimal
-            )
-            cursor.execute(sql, val)
-            self._connection.commit()
-            return cursor.lastrowid
+            with self._borrow() as conn:
+                val = (
+                    simulation.strategy_id,
+                    simulation.candidate_index,
+                    simulation.velocity_km_s,
+                    simulation.angle_degrees,
+                    simulation.timing_days,
+                    simulation.impactor_mass_kg,
+                    simulation.estimated_fuel_kg,
+                    simulation.is_optimal
+                )
+                cursor = self._prepared.execute(conn, _SQL_INS_SIM, val)
+                self._commit(conn)
+                return cursor.lastrowid
         except Error as e:
-            print(f"[Database] Error inserting simulation: {e}")
+            logger.error("Error inserting simulation", exc_info=e)
             return 0
-        finally:
-            cursor.close()
 
     def get_simulations(self, strategy_id: int) -> List[SimulationRun]:
         return []
 
     def update_simulation_optimal(self, simulation_id: int, is_optimal: bool) -> None:
         """Mark simulation as optimal."""
-        cursor = self._get_cursor()
         try:
-            cursor.execute("UPDATE simulation_run SET is_optimal = %s WHERE simulation_id = %s", (is_optimal, simulation_id))
-            self._connection.commit()
+            with self._borrow() as conn:
+                self._prepared.execute(conn, _SQL_UPDATE_SIM_OPTIMAL, (is_optimal, simulation_id))
+                self._commit(conn)
         except Error as e:
-            print(f"[Database] Error updating simulation: {e}")
-        finally:
-            cursor.close()
+            logger.error("Error updating simulation", exc_info=e)
     
     def insert_quantum_result(self, result: QuantumOptimizationResult) -> int:
         """Insert quantum result and return ID."""
-        cursor = self._get_cursor()
         try:
-            sql = """
-                INSERT INTO quantum_result 
-                (asteroid_id, optimal_simulation_id, optimal_index, success_probability, qubits_used, iterations, quantum_advantage, execution_time_ms)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            val = (
-                result.asteroid_id,
-                result.optimal_simulation_id,
-                result.optimal_index,
-                result.success_probability,
-                result.qubits_used,
-                result.iterations,
-                result.quantum_advantage,
-                result.execution_time_ms
-            )
-            cursor.execute(sql, val)
-            self._connection.commit()
-            return cursor.lastrowid
+            with self._borrow() as conn:
+                val = (
+                    result.asteroid_id,
+                    result.optimal_simulation_id,
+                    result.optimal_index,
+                    result.success_probability,
+                    result.qubits_used,
+                    result.iterations,
+                    result.quantum_advantage,
+                    result.execution_time_ms
+                )
+                cursor = self._prepared.execute(conn, _SQL_INS_QUANTUM, val)
+                self._commit(conn)
+                return cursor.lastrowid
         except Error as e:
-            print(f"[Database] Error inserting quantum_result: {e}")
+            logger.error("Error inserting quantum_result", exc_info=e)
             return 0
-        finally:
-            cursor.close()
 
     def get_quantum_result(self, asteroid_id: int) -> Optional[QuantumOptimizationResult]:
         return None
 
     def insert_safety_evaluation(self, evaluation: SafetyEvaluation) -> int:
         """Insert safety evaluation and return ID."""
-        cursor = self._get_cursor()
         try:
-            sql = """
-                INSERT INTO safety_evaluation 
-                (simulation_id, fragmentation_risk_pct, miss_distance_km, confidence_score, verdict, failed_checks_json)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            val = (
-                evaluation.simulation_id,
-                evaluation.fragmentation_risk_pct,
-                evaluation.miss_distance_km,
-                evaluation.confidence_score,
-                evaluation.verdict,
-                evaluation.failed_checks_json
-            )
-            cursor.execute(sql, val)
-            self._connection.commit()
-            return cursor.lastrowid
+            with self._borrow() as conn:
+                val = (
+                    evaluation.simulation_id,
+                    evaluation.fragmentation_risk_pct,
+                    evaluation.miss_distance_km,
+                    evaluation.confidence_score,
+                    evaluation.verdict,
+                    _pack(evaluation.failed_checks_json)
+                )
+                cursor = self._prepared.execute(conn, _SQL_INS_SAFETY, val)
+                self._commit(conn)
+                return cursor.lastrowid
         except Error as e:
-            print(f"[Database] Error inserting safety_evaluation: {e}")
+            logger.error("Error inserting safety_evaluation", exc_info=e)
             return 0
-        finally:
-            cursor.close()
 
     def get_safety_evaluation(self, simulation_id: int) -> Optional[SafetyEvaluation]:
         return None
 
     def insert_final_decision(self, decision: FinalDecision) -> int:
         """Insert final decision and return ID."""
-        cursor = self._get_cursor()
         try:
-            sql = """
-                INSERT INTO final_decision 
-                (asteroid_id, strategy_id, primary_simulation_id, backup_simulation_id, confidence_score, explanation, approved_by_humans)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """
-            val = (
-                decision.asteroid_id,
-                decision.strategy_id,
-                decision.primary_simulation_id,
-                decision.backup_simulation_id,
-                decision.confidence_score,
-                decision.explanation,
-                decision.approved_by_humans
-            )
-            cursor.execute(sql, val)
-            self._connection.commit()
-            return cursor.lastrowid
+            with self._borrow() as conn:
+                val = (
+                    decision.asteroid_id,
+                    decision.strategy_id,
+                    decision.primary_simulation_id,
+                    decision.backup_simulation_id,
+                    decision.confidence_score,
+                    decision.explanation,
+                    decision.approved_by_humans
+                )
+                cursor = self._prepared.execute(conn, _SQL_INS_FINAL, val)
+                self._commit(conn)
+                return cursor.lastrowid
         except Error as e:
-            print(f"[Database] Error inserting final_decision: {e}")
+            logger.error("Error inserting final_decision", exc_info=e)
             return 0
-        finally:
-            cursor.close()
 
     def get_final_decision(self, asteroid_id: int) -> Optional[FinalDecision]:
         return None
     
     def insert_log(self, log: AgentLog) -> int:
-        """Insert agent log and return ID."""
-        cursor = self._get_cursor()
+        """Queue agent log for the background writer (returns 0), else insert it now."""
+        writer = self._log_thread
+        if writer is not None and writer.is_alive():
+            try:
+                self._log_q.put_nowait(log)
+                return 0
+            except queue.Full:
+                logger.warning("Log queue full; writing agent log synchronously")
+        return self._insert_log_now(log)
+    
+    def _insert_log_now(self, log: AgentLog) -> int:
+        """Insert agent log on the caller's thread and return ID."""
         try:
-            sql = """
-                INSERT INTO agent_log 
-                (agent_name, action, related_id, details_json)
-                VALUES (%s, %s, %s, %s)
-            """
-            val = (
-                log.agent_name,
-                log.action,
-                log.related_id,
-                log.details_json
-            )
-            cursor.execute(sql, val)
-            self._connection.commit()
-            return cursor.lastrowid
+            with self._borrow() as conn:
+                val = (
+                    log.agent_name,
+                    log.action,
+                    log.related_id,
+                    _pack(log.details_json)
+                )
+                cursor = self._prepared.execute(conn, _SQL_INS_LOG, val)
+                self._commit(conn)
+                return cursor.lastrowid
         except Error as e:
-            print(f"[Database] Error inserting log: {e}")
+            logger.error("Error inserting log", exc_info=e)
             return 0
-        finally:
-            cursor.close()
+    
+    def _log_writer(self) -> None:
+        """Writer thread: write queued logs in batches until the None sentinel."""
+        stopping = False
+        while not stopping:
+            log = self._log_q.get()
+            if log is None:
+                break
+            batch = [log]
+            while len(batch) < self.LOG_BATCH_SIZE:
+                try:
+                    log = self._log_q.get(timeout=0.1)
+                except queue.Empty:
+                    break
+                if log is None:
+                    stopping = True
+                    break
+                batch.append(log)
+            try:
+                self._write_log_batch(batch)
+            except Exception:
+                # Keep the writer alive; a dead one would silently drop logs
+                logger.exception("Log writer failed on a batch")
+                self._log_unstored(batch)
+    
+    def _write_log_batch(self, batch: List[AgentLog]) -> None:
+        """bulk_insert_logs with one retry; unstored rows go to the aegis.db log."""
+        for attempt in range(2):
+            if self.bulk_insert_logs(batch):
+                return
+            if attempt == 0:
+                time.sleep(1.0)
+        self._log_unstored(batch)
+    
+    @staticmethod
+    def _log_unstored(batch: List[AgentLog]) -> None:
+        for log in batch:
+            logger.error(
+                "Agent log not stored: agent=%s action=%s related_id=%s details=%s",
+                log.agent_name, log.action, log.related_id, log.details_json
+            )
+    
+    def _stop_log_writer(self) -> None:
+        """Stop the writer thread once it has written everything queued."""
+        writer = self._log_thread
+        if writer is None:
+            return
+        self._log_thread = None
+        if writer.is_alive():
+            # None is the stop sentinel; the writer drains everything before it
+            try:
+                self._log_q.put(None, timeout=self.LOG_STOP_TIMEOUT_S)
+                writer.join(self.LOG_STOP_TIMEOUT_S)
+            except queue.Full:
+                pass
+            if writer.is_alive():
+                logger.warning("Log writer did not finish within %.0fs; queued agent logs "
+                               "may not be stored", self.LOG_STOP_TIMEOUT_S)
     
     def get_logs(self, agent_name: str = None) -> List[AgentLog]:
         """Get agent logs."""
-        cursor = self._get_cursor()
+        return list(self.iter_logs(agent_name))
+    
+    def iter_logs(self, agent_name: str = None, batch_size: int = 256) -> Iterator[AgentLog]:
+        """Stream agent logs from an unbuffered cursor."""
         try:
-            sql = "SELECT * FROM agent_log"
-            val = ()
-            if agent_name:
-                sql += " WHERE agent_name = %s"
-                val = (agent_name,)
-            
-            sql += " ORDER BY logged_at DESC LIMIT 100"
-            
-            cursor.execute(sql, val)
-            rows = cursor.fetchall()
-            
-            logs = []
-            for row in rows:
-                logs.append(AgentLog(
-                    log_id=row['log_id'],
-                    agent_name=row['agent_name'],
-                    action=row['action'],
-                    related_id=row['related_id'],
-                    details_json=row['details_json'],
-                    logged_at=str(row['logged_at'])
-                ))
-            return logs
+            with self._borrow() as conn:
+                cursor = conn.cursor(buffered=False)
+                try:
+                    if agent_name:
+                        cursor.execute(_SQL_GET_LOGS_BY_AGENT, (agent_name,))
+                    else:
+                        cursor.execute(_SQL_GET_LOGS)
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        for log_id, agent_name, action, related_id, details_json, logged_at in rows:
+                            yield AgentLog(
+                                log_id=log_id,
+                                agent_name=agent_name,
+                                action=action,
+                                related_id=related_id,
+                                details_json=_unpack(details_json),
+                                logged_at=str(logged_at)
+                            )
+                finally:
+                    # Drain rows left behind by a caller that stopped early
+                    if conn.unread_result:
+                        conn.consume_results()
+                    cursor.close()
         except Error as e:
-            print(f"[Database] Error fetching logs: {e}")
-            return []
-        finally:
-            cursor.close()
+            logger.error("Error fetching logs", exc_info=e)
+    
+    # -------------------- Bulk Operations --------------------
+    
+    def bulk_insert_risk_assessments(self, assessments: List[RiskAssessment]) -> List[int]:
+        """Insert risk assessments in multi-row batches and return their IDs."""
+        ids = self._bulk_insert(
+            'risk_assessment',
+            ('asteroid_id', 'impact_probability', 'kinetic_energy_mt', 'estimated_damage',
+             'risk_score', 'requires_deflection'),
+            [(a.asteroid_id, a.impact_probability, a.kinetic_energy_mt, a.estimated_damage,
+              a.risk_score, a.requires_deflection) for a in assessments]
+        )
+        for assessment, assessment_id in zip(assessments, ids):
+            assessment.assessment_id = assessment_id
+        self._get_risk_assessment.cache_clear()
+        return ids
+    
+    def bulk_insert_simulations(self, simulations: List[SimulationRun]) -> List[int]:
+        """Insert simulation runs in multi-row batches and return their IDs."""
+        ids = self._bulk_insert(
+            'simulation_run',
+            ('strategy_id', 'candidate_index', 'velocity_km_s', 'angle_degrees', 'timing_days',
+             'impactor_mass_kg', 'estimated_fuel_kg', 'is_optimal'),
+            [(s.strategy_id, s.candidate_index, s.velocity_km_s, s.angle_degrees, s.timing_days,
+              s.impactor_mass_kg, s.estimated_fuel_kg, s.is_optimal) for s in simulations]
+        )
+        for simulation, simulation_id in zip(simulations, ids):
+            simulation.simulation_id = simulation_id
+        return ids
+    
+    def bulk_insert_safety_evaluations(self, evaluations: List[SafetyEvaluation]) -> List[int]:
+        """Insert safety evaluations in multi-row batches and return their IDs."""
+        ids = self._bulk_insert(
+            'safety_evaluation',
+            ('simulation_id', 'fragmentation_risk_pct', 'miss_distance_km', 'confidence_score',
+             'verdict', 'failed_checks_json'),
+            [(e.simulation_id, e.fragmentation_risk_pct, e.miss_distance_km, e.confidence_score,
+              e.verdict, _pack(e.failed_checks_json)) for e in evaluations]
+        )
+        for evaluation, evaluation_id in zip(evaluations, ids):
+            evaluation.evaluation_id = evaluation_id
+        return ids
+    
+    def bulk_insert_logs(self, logs: List[AgentLog]) -> List[int]:
+        """Insert agent logs in multi-row batches and return their IDs."""
+        ids = self._bulk_insert(
+            'agent_log',
+            ('agent_name', 'action', 'related_id', 'details_json'),
+            [(l.agent_name, l.action, l.related_id, _pack(l.details_json)) for l in logs]
+        )
+        for log, log_id in zip(logs, ids):
+            log.log_id = log_id
+        return ids
+
+
+class AsyncMySQLDatabase:
+    """asyncio peer of MySQLDatabase (aiomysql) for write-heavy batch pipelines."""
+    
+    def __init__(self, host: str, port: int, user: str, password: str, database: str,
+                 pool_size: int = 10):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.database = database
+        self.pool_size = pool_size
+        self._pool = None
+    
+    async def connect(self) -> bool:
+        """Create the connection pool."""
+        if aiomysql is None:
+            raise ImportError("AsyncMySQLDatabase requires aiomysql (pip install aiomysql)")
+        try:
+            self._pool = await aiomysql.create_pool(
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self.password,
+                db=self.database,
+                minsize=1,
+                maxsize=self.pool_size,
+                autocommit=True
+            )
+            print(f"[Database] Connected to MySQL database (async): {self.database}")
+            return True
+        except aiomysql.Error as e:
+            print(f"[Database] Error connecting to MySQL: {e}")
+            self._pool = None
+        return False
+    
+    async def disconnect(self) -> None:
+        """Close the connection pool."""
+        if self._pool:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+            print("[Database] MySQL async connection pool closed")
+    
+    async def _insert(self, sql: str, val: tuple, table: str) -> int:
+        """Run one INSERT on a pooled connection and return the new row ID."""
+        try:
+            async with self._pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(sql, val)
+                    return cursor.lastrowid
+        except aiomysql.Error as e:
+            logger.error("Error inserting %s", table, exc_info=e)
+            return 0
+    
+    async def insert_risk_assessment(self, assessment: RiskAssessment) -> int:
+        """Insert risk assessment and return ID."""
+        return await self._insert(_SQL_INS_RISK, (
+            assessment.asteroid_id,
+            assessment.impact_probability,
+            assessment.kinetic_energy_mt,
+            assessment.estimated_damage,
+            assessment.risk_score,
+            assessment.requires_deflection
+        ), 'risk_assessment')
+    
+    async def insert_simulation(self, sim: SimulationRun) -> int:
+        """Insert simulation run and return ID."""
+        return await self._insert(_SQL_INS_SIM, (
+            sim.strategy_id,
+            sim.candidate_index,
+            sim.velocity_km_s,
+            sim.angle_degrees,
+            sim.timing_days,
+            sim.impactor_mass_kg,
+            sim.estimated_fuel_kg,
+            sim.is_optimal
+        ), 'simulation')
+    
+    async def insert_safety_evaluation(self, evaluation: SafetyEvaluation) -> int:
+        """Insert safety evaluation and return ID."""
+        return await self._insert(_SQL_INS_SAFETY, (
+            evaluation.simulation_id,
+            evaluation.fragmentation_risk_pct,
+            evaluation.miss_distance_km,
+            evaluation.confidence_score,
+            evaluation.verdict,
+            _pack(evaluation.failed_checks_json)
+        ), 'safety_evaluation')
+    
+    async def insert_log(self, log: AgentLog) -> int:
+        """Insert agent log and return ID."""
+        return await self._insert(_SQL_INS_LOG, (
+            log.agent_name,
+            log.action,
+            log.related_id,
+            _pack(log.details_json)
+        ), 'log')
+    
+    async def insert_simulations(self, simulations: List[SimulationRun]) -> List[int]:
+        """Insert simulation runs concurrently across the pool and return their IDs."""
+        ids = await asyncio.gather(*[self.insert_simulation(s) for s in simulations])
+        for sim, simulation_id in zip(simulations, ids):
+            sim.simulation_id = simulation_id
+        return list(ids)
+    
+    async def insert_logs(self, logs: List[AgentLog]) -> List[int]:
+        """Insert agent logs concurrently across the pool and return their IDs."""
+        ids = await asyncio.gather(*[self.insert_log(l) for l in logs])
+        for log, log_id in zip(logs, ids):
+            log.log_id = log_id
+        return list(ids)
 
 
 # ============================================================================
 # FACTORY FUNCTION
 # ============================================================================
 
-# Global database instance
-_database: Optional[DatabaseInterface] = None
+@functools.lru_cache(maxsize=1)
+def _build_database() -> DatabaseInterface:
+    """Create and connect the configured database (runs once until reset)."""
+    from .config import get_config
+    config = get_config()
+    
+    if config.database.db_type == "mysql":
+        if not logger.handlers:
+            handler = RotatingFileHandler(config.database.log_file, maxBytes=5 * 1024 * 1024, backupCount=3)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+            logger.addHandler(handler)
+        database = MySQLDatabase(
+            host=config.database.mysql_host,
+            port=config.database.mysql_port,
+            user=config.database.mysql_user,
+            password=config.database.mysql_password,
+            database=config.database.mysql_database
+        )
+    else:
+        # Default to in-memory
+        database = InMemoryDatabase()
+    
+    database.connect()
+    return database
 
 
 def get_database() -> DatabaseInterface:
@@ -873,32 +1807,11 @@ def get_database() -> DatabaseInterface:
     Get the global database instance.
     Creates instance on first call based on configuration.
     """
-    global _database
-    
-    if _database is None:
-        from .config import get_config
-        config = get_config()
-        
-        if config.database.db_type == "mysql":
-            _database = MySQLDatabase(
-                host=config.database.mysql_host,
-                port=config.database.mysql_port,
-                user=config.database.mysql_user,
-                password=config.database.mysql_password,
-                database=config.database.mysql_database
-            )
-        else:
-            # Default to in-memory
-            _database = InMemoryDatabase()
-        
-        _database.connect()
-    
-    return _database
+    return _build_database()
 
 
 def reset_database() -> None:
     """Reset the database connection (useful for testing)."""
-    global _database
-    if _database:
-        _database.disconnect()
-    _database = None
+    if _build_database.cache_info().currsize:
+        _build_database().disconnect()
+    _build_database.cache_clear()
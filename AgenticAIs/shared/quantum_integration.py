@@ -10,6 +10,11 @@ import math
 import time
 from typing import Dict, List, Any, Optional
 
+import numpy as np
+
+# GROVER_DEBUG=1 restores the per-run "[Quantum] ..." console notes
+_DEBUG = os.environ.get('GROVER_DEBUG') == '1'
+
 def run_quantum_optimization(
     candidates: List[Dict[str, Any]],
     oracle_constraints: Optional[Dict[str, Any]] = None
@@ -51,14 +56,18 @@ def run_quantum_optimization(
         raise ValueError(f"Exactly 16 candidates required, got {len(candidates)}")
     
     # Ensure all candidates have required fields
+    unscored = []
     for i, c in enumerate(candidates):
         if 'id' not in c:
             c['id'] = i
         if 'validity' not in c:
             c['validity'] = True
         if 'score' not in c:
-            # Calculate a score based on available parameters
-            c['score'] = _calculate_candidate_score(c, oracle_constraints)
+            unscored.append(c)
+    if unscored:
+        # Calculate scores based on available parameters
+        for c, score in zip(unscored, _batch_scores(unscored, oracle_constraints)):
+            c['score'] = score
     
     # The external Quantum Grover module has been removed from this
     # distribution. Use the classical fallback implementation which
@@ -76,38 +85,30 @@ def run_quantum_optimization(
     return result
 
 
-def _calculate_candidate_score(
-    candidate: Dict[str, Any],
+def _batch_scores(
+    candidates: List[Dict[str, Any]],
     constraints: Optional[Dict[str, Any]] = None
-) -> float:
-    """Calculate a feasibility score for a candidate."""
-    score = 0.5  # Base score
-    
-    # Prefer moderate velocities (10-15 km/s is ideal)
-    velocity = candidate.get('velocity_km_s', 10)
-    if 10 <= velocity <= 15:
-        score += 0.2
-    elif velocity < 8 or velocity > 20:
-        score -= 0.2
-    
-    # Prefer angles between 15-45 degrees
-    angle = candidate.get('angle_degrees', 30)
-    if 15 <= angle <= 45:
-        score += 0.2
-    elif angle < 10 or angle > 60:
-        score -= 0.1
-    
-    # Apply constraint-based scoring if constraints provided
+) -> List[float]:
+    """
+    Feasibility score in [0, 1] for each candidate: a 0.5 base, adjusted for
+    velocity (10-15 km/s ideal), angle (15-45 degrees ideal) and, when
+    constraints are given, fuel against max_fuel.
+    """
+    n = len(candidates)
+    vel = np.fromiter((c.get('velocity_km_s', 10) for c in candidates), dtype=np.float64, count=n)
+    angle = np.fromiter((c.get('angle_degrees', 30) for c in candidates), dtype=np.float64, count=n)
+    
+    score = np.full(n, 0.5)
+    score += np.where((vel >= 10) & (vel <= 15), 0.2, np.where((vel < 8) | (vel > 20), -0.2, 0.0))
+    score += np.where((angle >= 15) & (angle <= 45), 0.2, np.where((angle < 10) | (angle > 60), -0.1, 0.0))
+    
     if constraints:
-        # Lower fuel is better
-        fuel = candidate.get('estimated_fuel_kg', 3000)
+        fuel = np.fromiter((c.get('estimated_fuel_kg', 3000) for c in candidates), dtype=np.float64, count=n)
         max_fuel = constraints.get('max_fuel', 5000)
-        if fuel < max_fuel * 0.7:
-            score += 0.1
-        elif fuel > max_fuel:
-            score -= 0.3
+        score += np.where(fuel < max_fuel * 0.7, 0.1, np.where(fuel > max_fuel, -0.3, 0.0))
     
-    return max(0.0, min(1.0, score))
+    np.clip(score, 0.0, 1.0, out=score)
+    return score.tolist()
 
 
 # Note: real quantum execution support was removed. The classical fallback
@@ -119,18 +120,19 @@ def _run_classical_fallback(candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
     Classical fallback when quantum module is not available.
     Simply finds the best valid candidate by score.
     """
-    print("[Quantum] Using classical fallback (no quantum advantage)")
+    if _DEBUG:
+        print("[Quantum] Using classical fallback (no quantum advantage)")
     
-    valid_candidates = [c for c in candidates if c.get('validity', True)]
-    if not valid_candidates:
+    # Single pass for the best valid candidate by score (first wins on ties)
+    optimal_idx, best_score = -1, -math.inf
+    for i, c in enumerate(candidates):
+        if c.get('validity', True):
+            score = c.get('score', 0)
+            if score > best_score:
+                optimal_idx, best_score = i, score
+    if optimal_idx < 0:
         # If no valid candidates, return first one
         optimal_idx = 0
-    else:
-        # Find best by score
-        optimal_idx = max(
-            (i for i, c in enumerate(candidates) if c.get('validity', True)),
-            key=lambda i: candidates[i].get('score', 0)
-        )
     
     return {
         'optimal_index': optimal_idx,
@@ -142,6 +144,19 @@ def _run_classical_fallback(candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+# Filler for the unused slots of the 16-entry search space
+_PADDING = {
+    'velocity_km_s': 10.0,
+    'angle_degrees': 30.0,
+    'impactor_mass_kg': 500,
+    'estimated_fuel_kg': 3000,
+    'estimated_miss_km': 10000,
+    'score': 0.1,
+    'validity': False,  # Padding candidates are invalid
+    'strategy': 'padding',
+}
+
+
 def prepare_candidates_for_quantum(
     raw_candidates: List[Dict[str, Any]],
     constraints: Dict[str, Any]
@@ -159,9 +174,11 @@ def prepare_candidates_for_quantum(
     Returns:
         List of 16 candidates formatted for quantum optimization
     """
-    formatted = []
+    formatted = [None] * 16
+    raw_candidates = raw_candidates[:16]
+    scores = _batch_scores(raw_candidates, constraints)
     
-    for i, c in enumerate(raw_candidates[:16]):
+    for i, c in enumerate(raw_candidates):
         # Determine validity based on constraints
         velocity = c.get('velocity_km_s', 10)
         angle = c.get('angle_degrees', 30)
@@ -181,33 +198,25 @@ def prepare_candidates_for_quantum(
         if est_frag > max_frag:
             is_valid = False
         
-        formatted.append({
+        formatted[i] = {
             'id': i,
             'velocity_km_s': c.get('velocity_km_s', velocity),
             'angle_degrees': c.get('angle_degrees', angle),
             'impactor_mass_kg': c.get('impactor_mass_kg', 500),
             'estimated_fuel_kg': c.get('estimated_fuel_kg', 3000),
             'estimated_miss_km': c.get('estimated_miss_km', 15000),
-            'score': _calculate_candidate_score(c, constraints),
+            'score': scores[i],
             'validity': is_valid,
             'strategy': c.get('strategy', 'kinetic'),
-        })
+        }
     
     # Pad to 16 if needed
-    while len(formatted) < 16:
-        formatted.append({
-            'id': len(formatted),
-            'velocity_km_s': 10.0,
-            'angle_degrees': 30.0,
-            'impactor_mass_kg': 500,
-            'estimated_fuel_kg': 3000,
-            'estimated_miss_km': 10000,
-            'score': 0.1,
-            'validity': False,  # Padding candidates are invalid
-            'strategy': 'padding',
-        })
-    
-    return formatted[:16]
+    for i in range(len(raw_candidates), 16):
+        pad = _PADDING.copy()
+        pad['id'] = i
+        formatted[i] = pad
+    
+    return formatted
 
 
 # Test function
@@ -19,8 +19,44 @@ USE aegis_db;
 --     asteroid_id INT PRIMARY KEY AUTO_INCREMENT,
 --     name VARCHAR(255) NOT NULL,
 --     ...
+--     UNIQUE KEY uq_asteroid_name (name),
+--     FULLTEXT INDEX ft_asteroid_name (name)
 -- );
 
+-- Name lookups: exact match uses the unique index (which also backs the
+-- insert_asteroid upsert), fuzzy fallback uses FULLTEXT. The existing table
+-- gets them below; each ALTER only runs when its index is missing, so the
+-- script can be re-run.
+--
+-- The unique key is skipped while names are duplicated. To dedupe, list
+-- the duplicates:
+--   SELECT Name, COUNT(*) FROM asteroid GROUP BY Name HAVING COUNT(*) > 1;
+-- then keep the lowest Asteroid_ID per name. Rows in the tables below that
+-- reference a removed asteroid are deleted with it (ON DELETE CASCADE), so
+-- repoint any that should be kept first:
+--   DELETE a FROM asteroid a JOIN asteroid b ON a.Name = b.Name AND a.Asteroid_ID > b.Asteroid_ID;
+-- and re-run this script.
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'asteroid' AND index_name = 'uq_asteroid_name') > 0
+    OR (SELECT COUNT(*) FROM (SELECT Name FROM asteroid GROUP BY Name HAVING COUNT(*) > 1) AS dup) > 0,
+    'DO 0',
+    'ALTER TABLE asteroid ADD UNIQUE KEY uq_asteroid_name (Name)'
+);
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'asteroid' AND index_name = 'ft_asteroid_name') > 0,
+    'DO 0',
+    'ALTER TABLE asteroid ADD FULLTEXT INDEX ft_asteroid_name (Name)'
+);
+PREPARE stmt FROM @ddl;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
 -- Risk Assessment table: Agent 1 output
 CREATE TABLE IF NOT EXISTS risk_assessment (
     assessment_id INT PRIMARY KEY AUTO_INCREMENT,
@@ -99,7 +135,7 @@ CREATE TABLE IF NOT EXISTS safety_evaluation (
     miss_distance_km DOUBLE NOT NULL,
     confidence_score DOUBLE NOT NULL,
     verdict VARCHAR(20) NOT NULL,  -- APPROVE or REJECT
-    failed_checks_json TEXT,
+    failed_checks_json MEDIUMBLOB,  -- zlib-compressed JSON
     feedback TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
@@ -135,7 +171,7 @@ CREATE TABLE IF NOT EXISTS agent_log (
     agent_name VARCHAR(50) NOT NULL,
     action VARCHAR(100) NOT NULL,
     related_id INT,
-    details_json TEXT,
+    details_json MEDIUMBLOB,  -- zlib-compressed JSON
     logged_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
     INDEX idx_agent (agent_name),
@@ -143,6 +179,12 @@ CREATE TABLE IF NOT EXISTS agent_log (
     INDEX idx_logged_at (logged_at)
 );
 
+-- Migration for databases created before the JSON columns were compressed:
+-- TEXT -> MEDIUMBLOB keeps the stored bytes (plain JSON, which the reader
+-- still accepts). Safe to re-run.
+ALTER TABLE safety_evaluation MODIFY failed_checks_json MEDIUMBLOB;
+ALTER TABLE agent_log MODIFY details_json MEDIUMBLOB;
+
 -- ============================================================================
 -- VIEWS FOR COMMON QUERIES
 -- ============================================================================
@@ -185,7 +227,8 @@ ORDER BY agent_name, action_count DESC;
 -- SAMPLE DATA FOR TESTING
 -- ============================================================================
 
-INSERT INTO asteroid (name, diameter_m, mass_kg, velocity_km_s, composition, impact_probability, days_until_approach)
+-- IGNORE: the sample names already exist when the script is re-run
+INSERT IGNORE INTO asteroid (name, diameter_m, mass_kg, velocity_km_s, composition, impact_probability, days_until_approach)
 VALUES 
     ('Apophis-99942', 340, 2.7e10, 30.0, 'Stony-Iron', 0.45, 1000),
     ('Bennu-101955', 500, 7.3e10, 28.0, 'Rubble Pile', 0.05, 36500),
@@ -45,7 +45,7 @@ function initQuantumSearch() {
         btn.innerHTML = '⚡ Running Quantum Circuit...';
 
         try {
-            const response = await fetch('http://localhost:5000/run-grover');
+            const response = await fetch('http://localhost:5000/run-grover?image=1');
             const data = await response.json();
 
             if (data.status === 'success') {
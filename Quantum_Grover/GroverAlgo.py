@@ -1,70 +1,92 @@
 import json
 import math
+import os
 import matplotlib.pyplot as plt
 import io
 import base64
+import threading
+from functools import lru_cache
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from qiskit import QuantumCircuit, transpile
 from qiskit_aer import AerSimulator
 from qiskit.visualization import plot_histogram
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# Shared simulator; circuits are tiny, so single precision and one thread
+_BACKEND = AerSimulator(
+    method='statevector',
+    precision='single',
+    max_parallel_threads=1,
+    max_parallel_experiments=1,
+    seed_simulator=0,
+)
+
+# The target is measured with p ≈ 0.96 on 4 qubits
+DEFAULT_SHOTS = 8
+
+HISTOGRAM_TITLE = "Quantum Search Results (Amplified Target)"
+
+PNG_DATA_URI_PREFIX = "data:image/png;base64,"
+
+# GROVER_DEBUG=1 prints the oracle and diffuser circuits as they are built
+_DEBUG_DRAW = os.environ.get('GROVER_DEBUG') == '1'
+
+# One reused Agg figure for server-side renders
+_FIGURE = None
+_FIGURE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=64)
 def build_oracle(n_qubits, target_index):
 
     oracle_qc = QuantumCircuit(n_qubits, name="Oracle")
-    target_bin = format(target_index, f'0{n_qubits}b')[::-1]
+    # Qubits whose bit is 0 in the target (qubit i holds bit i)
+    zero_bits = [i for i in range(n_qubits) if not (target_index >> i) & 1]
     
-    for i, bit in enumerate(target_bin):
-        if bit == '0': oracle_qc.x(i)
+    for i in zero_bits: oracle_qc.x(i)
     
-    oracle_qc.h(n_qubits - 1)
-    oracle_qc.mcx(list(range(n_qubits - 1)), n_qubits - 1)
-    oracle_qc.h(n_qubits - 1)
+    # Multi-controlled Z (same as H-MCX-H)
+    oracle_qc.mcp(math.pi, list(range(n_qubits - 1)), n_qubits - 1)
     
-    for i, bit in enumerate(target_bin):
-        if bit == '0': oracle_qc.x(i)
+    for i in zero_bits: oracle_qc.x(i)
     
-    print("\n--- Oracle Circuit ---")
-    print(oracle_qc.draw(output='text'))
-    return oracle_qc
+    if _DEBUG_DRAW:
+        print("\n--- Oracle Circuit ---")
+        print(oracle_qc.draw(output='text'))
+    return oracle_qc.to_gate()
 
 
+@lru_cache(maxsize=8)
 def build_diffuser(n_qubits):
 
     diff_qc = QuantumCircuit(n_qubits, name="Diffuser")
     diff_qc.h(range(n_qubits))
     diff_qc.x(range(n_qubits))
-    diff_qc.h(n_qubits - 1)
-    diff_qc.mcx(list(range(n_qubits - 1)), n_qubits - 1)
-    diff_qc.h(n_qubits - 1)
+    diff_qc.mcp(math.pi, list(range(n_qubits - 1)), n_qubits - 1)
     diff_qc.x(range(n_qubits))
     diff_qc.h(range(n_qubits))
 
-    print("\n--- Diffuser Circuit ---")
-    print(diff_qc.draw(output='text'))
-
-    return diff_qc
+    if _DEBUG_DRAW:
+        print("\n--- Diffuser Circuit ---")
+        print(diff_qc.draw(output='text'))
 
+    return diff_qc.to_gate()
 
-def run_quantum_maneuver_search(file_path, return_image=False):
 
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-        maneuvers = data.get('maneuvers', [])
-
-    best_idx = max((i for i, m in enumerate(maneuvers) if m.get('validity')), 
-                   key=lambda i: maneuvers[i].get('score', 0), default=None)
-
-    if best_idx is None:
-        print("No valid maneuvers found.")
-        return None
-
-    n_qubits = math.ceil(math.log2(len(maneuvers)))
+@lru_cache(maxsize=32)
+def build_grover_circuit(n_qubits, target_index):
+    """Grover circuit for one marked index, transpiled for _BACKEND."""
     qc = QuantumCircuit(n_qubits)
-    
     qc.h(range(n_qubits))
-    
-    iterations = max(1, round(math.pi/4 * math.sqrt(2**n_qubits)))
-    oracle = build_oracle(n_qubits, best_idx)
+
+    iterations = grover_iterations(n_qubits)
+    oracle = build_oracle(n_qubits, target_index)
     diffuser = build_diffuser(n_qubits)
 
     for _ in range(iterations):
@@ -72,32 +94,186 @@ def run_quantum_maneuver_search(file_path, return_image=False):
         qc.append(diffuser, range(n_qubits))
 
     qc.measure_all()
+    return transpile(qc, _BACKEND)
+
+
+def grover_iterations(n_qubits):
+    return max(1, round(math.pi/4 * math.sqrt(2**n_qubits)))
+
+
+@lru_cache(maxsize=8)
+def basis_labels(n_qubits):
+    """Count keys of every basis state, indexed by state number."""
+    return tuple(format(i, f'0{n_qubits}b') for i in range(2**n_qubits))
+
+
+def analytic_counts(n_qubits, target_index, shots):
+    """Expected counts from P(target) = sin^2((2k+1)θ), sin θ = 1/√N."""
+    n_states = 2**n_qubits
+    theta = math.asin(1 / math.sqrt(n_states))
+    p_target = math.sin((2 * grover_iterations(n_qubits) + 1) * theta) ** 2
+
+    hits = round(shots * p_target)
+    rest, extra = divmod(shots - hits, n_states - 1)
+    counts = {}
+    for i, label in enumerate(basis_labels(n_qubits)):
+        if i == target_index:
+            counts[label] = hits
+        else:
+            share = rest + (1 if extra > 0 else 0)
+            extra -= 1
+            if share:
+                counts[label] = share
+    return counts
 
-    backend = AerSimulator()
-    tqc = transpile(qc, backend)
-    result = backend.run(tqc, shots=2048).result()
-    counts = result.get_counts()
+
+# Maneuvers are a list of dicts or the array form {"ids", "scores", "validity"}
+
+def maneuvers_of(data):
+    return data if 'ids' in data else data.get('maneuvers', [])
+
+
+def maneuver_count(maneuvers):
+    return len(maneuvers['ids']) if isinstance(maneuvers, dict) else len(maneuvers)
+
+
+def maneuver_at(maneuvers, i):
+    if isinstance(maneuvers, dict):
+        return {
+            "id": int(maneuvers['ids'][i]),
+            "score": float(maneuvers['scores'][i]),
+            "validity": bool(maneuvers['validity'][i])
+        }
+    return maneuvers[i]
+
+
+def best_maneuver_index(maneuvers):
+    if isinstance(maneuvers, dict):
+        # Ties go to the lowest index, as with max() below
+        validity = maneuvers['validity']
+        if not validity.any():
+            return None
+        return int(np.where(validity, maneuvers['scores'], -np.inf).argmax())
+    return max((i for i, m in enumerate(maneuvers) if m.get('validity')), 
+               key=lambda i: maneuvers[i].get('score', 0), default=None)
+
+
+def run_quantum_maneuver_search_batch(maneuver_sets, shots=DEFAULT_SHOTS, include_counts=False):
+    """Search several maneuver lists in one backend.run job."""
+    targets = [best_maneuver_index(maneuvers) for maneuvers in maneuver_sets]
+    jobs = [(k, build_grover_circuit(math.ceil(math.log2(maneuver_count(maneuvers))), best_idx))
+            for k, (maneuvers, best_idx) in enumerate(zip(maneuver_sets, targets))
+            if best_idx is not None]
+
+    results = [None] * len(maneuver_sets)
+    if not jobs:
+        return results
+
+    run = _BACKEND.run([tqc for _, tqc in jobs], shots=shots).result()
+    for slot, (k, _) in enumerate(jobs):
+        results[k] = {"maneuver": maneuver_at(maneuver_sets[k], targets[k])}
+        if include_counts:
+            results[k]["counts"] = run.get_counts(slot)
+    return results
+
+
+def render_histogram_png(counts, save_path=None):
+    """Histogram PNG as a BytesIO, or written to save_path (returned)."""
+    global _FIGURE
+    img = io.BytesIO()
+    with _FIGURE_LOCK:
+        if _FIGURE is None:
+            _FIGURE = Figure()
+            FigureCanvasAgg(_FIGURE)
+        _FIGURE.clear()
+        ax = _FIGURE.add_subplot()
+        plot_histogram(counts, ax=ax)
+        # plot_histogram only titles figures it creates itself
+        _FIGURE.suptitle(HISTOGRAM_TITLE)
+        _FIGURE.savefig(img, format='png')
+    if save_path is None:
+        return img
+    return write_png(save_path, img.getbuffer())
+
+
+def write_png(path, png):
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(png)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return path
+
+
+def load_maneuvers(file_path):
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(file_path, 'r') as f:
+            data = json.load(f)
+    return data.get('maneuvers', [])
+
+
+def histogram_data_uri(counts):
+    img = render_histogram_png(counts)
+    return PNG_DATA_URI_PREFIX + base64.b64encode(img.getbuffer()).decode()
+
+
+def search_maneuvers(maneuvers, simulate=True, shots=DEFAULT_SHOTS, include_counts=False):
+    best_idx = best_maneuver_index(maneuvers)
+
+    if best_idx is None:
+        print("No valid maneuvers found.")
+        return None
+
+    n_qubits = math.ceil(math.log2(maneuver_count(maneuvers)))
+    if simulate:
+        tqc = build_grover_circuit(n_qubits, best_idx)
+        result = _BACKEND.run(tqc, shots=shots).result()
+        counts = result.get_counts()
+    else:
+        counts = analytic_counts(n_qubits, best_idx, shots)
 
     print(f"Targeting Maneuver at Index: {best_idx}")
+    found = {"maneuver": maneuver_at(maneuvers, best_idx)}
+    if include_counts:
+        found["counts"] = counts
+    return found
+
+
+def run_quantum_maneuver_search(source, return_image=False, simulate=True, shots=DEFAULT_SHOTS,
+                                save_path=None):
+    """source is a maneuver JSON path or an already parsed input."""
+    maneuvers = maneuvers_of(source) if isinstance(source, dict) else load_maneuvers(source)
+    found = search_maneuvers(maneuvers, simulate=simulate, shots=shots, include_counts=True)
+    if found is None:
+        return None
     
-    if return_image:
-        plt.figure()
-        plot_histogram(counts, title="Quantum Search Results (Amplified Target)")
-        img = io.BytesIO()
-        plt.savefig(img, format='png')
-        img.seek(0)
-        plot_url = base64.b64encode(img.getvalue()).decode()
-        plt.close()
+    if save_path is not None:
+        return {
+            "maneuver": found["maneuver"],
+            "plot_path": render_histogram_png(found["counts"], save_path)
+        }
+    elif return_image == 'bytes':
         return {
-            "maneuver": maneuvers[best_idx],
-            "plot_image": f"data:image/png;base64,{plot_url}"
+            "maneuver": found["maneuver"],
+            "plot_image_bytes": render_histogram_png(found["counts"]).getvalue()
+        }
+    elif return_image:
+        return {
+            "maneuver": found["maneuver"],
+            "plot_image": histogram_data_uri(found["counts"])
         }
     else:
-        plot_histogram(counts, title="Quantum Search Results (Amplified Target)")
-        plt.show()
-
         print("\n--- Quantum Search Result ---")
-        print(json.dumps(maneuvers[best_idx], indent=4))
+        print(json.dumps(found["maneuver"], indent=4))
+        return found
 
 if __name__ == '__main__':
-    run_quantum_maneuver_search('maneuver_demo.json')
\ No newline at end of file
+    found = run_quantum_maneuver_search('maneuver_demo.json')
+    if found:
+        plot_histogram(found["counts"], title=HISTOGRAM_TITLE)
+        plt.show()
\ No newline at end of file
@@ -2,12 +2,19 @@ from flask import Flask, jsonify, request
 from flask_cors import CORS
 import GroverAlgo
 import os
-import mysql.connector
-from mysql.connector import Error
+import threading
+import time
+from mysql.connector import Error, pooling
+from mysql.connector.errors import PoolError
 
 app = Flask(__name__)
 CORS(app)
 
+# The demo maneuver file is static, so parse it once at startup
+DEMO_MANEUVERS = GroverAlgo.load_maneuvers(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'maneuver_demo.json')
+)
+
 # Database Configuration
 DB_CONFIG = {
     'host': 'localhost',
@@ -16,23 +23,59 @@ DB_CONFIG = {
     'password': 'Dps3!2006'  # Default from schema.sql, user might need to change
 }
 
+_POOL = None
+_POOL_LOCK = threading.Lock()
+# How long a request waits for a free pooled connection before giving up
+POOL_WAIT_S = 2.0
+
+def _get_pool():
+    """Create the pool on first use (so the server still starts without MySQL)."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = pooling.MySQLConnectionPool(pool_name='aegis', pool_size=8, **DB_CONFIG)
+    return _POOL
+
 def get_db_connection():
+    """
+    Borrow a pooled connection; close() hands it back to the pool.
+    Raises PoolError if all connections stay busy for POOL_WAIT_S.
+    """
     try:
-        connection = mysql.connector.connect(**DB_CONFIG)
-        if connection.is_connected():
-            return connection
+        pool = _get_pool()
+        deadline = time.monotonic() + POOL_WAIT_S
+        while True:
+            try:
+                return pool.get_connection()
+            except PoolError:
+                # The stock pool doesn't block when exhausted
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.05)
+    except PoolError:
+        raise
     except Error as e:
         print(f"Error connecting to MySQL: {e}")
         return None
 
+@app.errorhandler(PoolError)
+def pool_exhausted(e):
+    response = jsonify({
+        "status": "error",
+        "message": "Database busy, try again"
+    })
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
 @app.route('/asteroids', methods=['GET'])
 def get_asteroids():
     connection = get_db_connection()
     if connection:
         try:
-            cursor = connection.cursor(dictionary=True)
-            cursor.execute("SELECT * FROM asteroid")
-            asteroids = cursor.fetchall()
+            with connection.cursor(dictionary=True) as cursor:
+                cursor.execute("SELECT * FROM asteroid")
+                asteroids = cursor.fetchall()
             return jsonify({
                 "status": "success",
                 "data": asteroids
@@ -43,9 +86,7 @@ def get_asteroids():
                 "message": str(e)
             }), 500
         finally:
-            if connection.is_connected():
-                cursor.close()
-                connection.close()
+            connection.close()
     else:
         return jsonify({
             "status": "error",
@@ -63,57 +104,48 @@ def search_asteroid():
     connection = get_db_connection()
     if connection:
         try:
-            cursor = connection.cursor(dictionary=True)
-            # Simple keyword search: Check if any asteroid name is in the prompt
-            # First, get all asteroid names to check against prompt (efficient for small DB)
-            cursor.execute("SELECT name FROM asteroid")
-            all_names = cursor.fetchall()
-            
-            target_name = None
-            for item in all_names:
-                if item['name'].lower() in prompt.lower():
-                    target_name = item['name']
-                    break
-            
-            # Fallback: SQL LIKE search if exact name not found in prompt
-            if not target_name:
-                # This is a bit loose, searching if prompt contains parts of name
-                # For now, let's just search if the prompt *is* the name or contains it directly
-                pass 
-
-            if target_name:
-                 cursor.execute("SELECT * FROM asteroid WHERE name = %s", (target_name,))
-                 asteroid = cursor.fetchone()
-                 return jsonify({"status": "success", "data": asteroid})
-            
-            # Try searching for partial matches directly in DB based on prompt words
-            words = prompt.split()
-            for word in words:
-                if len(word) > 3: # Avoid short words
-                     cursor.execute("SELECT * FROM asteroid WHERE name LIKE %s", (f"%{word}%",))
-                     asteroid = cursor.fetchone()
-                     if asteroid:
-                         return jsonify({"status": "success", "data": asteroid})
+            # One query: an asteroid whose name appears in the prompt wins,
+            # otherwise the first prompt word (longer than 3 chars) that
+            # partially matches a name, in prompt order
+            words = [f"%{word}%" for word in prompt.split() if len(word) > 3]
+            like_clauses = "".join(f" WHEN name LIKE %s THEN {i}" for i in range(1, len(words) + 1))
+            sql = (
+                "SELECT * FROM asteroid"
+                " WHERE LOCATE(LOWER(name), %s) > 0" + " OR name LIKE %s" * len(words) +
+                " ORDER BY CASE WHEN LOCATE(LOWER(name), %s) > 0 THEN 0" + like_clauses + " END"
+                " LIMIT 1"
+            )
+            prompt_lower = prompt.lower()
+            with connection.cursor(dictionary=True) as cursor:
+                cursor.execute(sql, (prompt_lower, *words, prompt_lower, *words))
+                asteroid = cursor.fetchone()
+            if asteroid:
+                return jsonify({"status": "success", "data": asteroid})
 
             return jsonify({"status": "error", "message": "Asteroid not identified in prompt"}), 404
 
         except Error as e:
             return jsonify({"status": "error", "message": str(e)}), 500
         finally:
-            if connection.is_connected():
-                cursor.close()
-                connection.close()
+            connection.close()
     else:
         return jsonify({"status": "error", "message": "Database connection failed"}), 500
 
 @app.route('/run-grover', methods=['GET'])
 def run_grover():
     try:
-        # Use the existing maneuver_demo.json
-        curent_dir = os.path.dirname(os.path.abspath(__file__))
-        json_path = os.path.join(curent_dir, 'maneuver_demo.json')
-        
-        result = GroverAlgo.run_quantum_maneuver_search(json_path, return_image=True)
+        # ?simulate=0 returns the closed-form distribution instead of running Aer;
+        # the histogram PNG is only rendered for ?image=1 and the raw
+        # measurement counts are only returned for ?counts=1
+        simulate = request.args.get('simulate', '1') != '0'
+        want_image = request.args.get('image') == '1'
+        want_counts = request.args.get('counts') == '1'
+        result = GroverAlgo.search_maneuvers(DEMO_MANEUVERS, simulate=simulate,
+                                             include_counts=want_image or want_counts)
+        if result and want_image:
+            result["plot_image"] = GroverAlgo.histogram_data_uri(result["counts"])
+            if not want_counts:
+                del result["counts"]
         
         if result:
             return jsonify({
@@ -133,4 +165,7 @@ def run_grover():
         }), 500
 
 if __name__ == '__main__':
-    app.run(port=5000, debug=True)
+    # Threaded so a /run-grover search doesn't hold up other requests; for
+    # production run it under gunicorn instead:
+    #   gunicorn --workers 4 --threads 2 -b 0.0.0.0:5000 server:app
+    app.run(port=5000, debug=True, threaded=True)
@@ -1,61 +1,146 @@
 
 import json
-import base64
+import logging
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-# Add path to include Quantum_Grover module
-sys.path.append(os.path.join(os.getcwd(), 'Quantum_Grover'))
+import numpy as np
 
-try:
-    import GroverAlgo
-except ImportError:
-    # Fallback if running from root
-    sys.path.append(os.path.join(os.getcwd(), 'A.I.D.S', 'Quantum_Grover'))
-    import GroverAlgo
+logger = logging.getLogger("aegis.histogram")
+
+# Resolved once; the script only ever works relative to where it was started
+_CWD = os.getcwd()
+OUTPUT_FILE = os.path.join(_CWD, 'quantum_histogram.png')
+
+
+@lru_cache(maxsize=None)
+def _import_grover():
+    """
+    Import GroverAlgo on first use, so importing this script doesn't pull
+    in Qiskit and matplotlib; the sys.path entries are added only once.
+    """
+    # Add path to include Quantum_Grover module
+    sys.path.append(os.path.join(_CWD, 'Quantum_Grover'))
+
+    try:
+        import GroverAlgo
+    except ImportError:
+        # Fallback if running from root
+        sys.path.append(os.path.join(_CWD, 'A.I.D.S', 'Quantum_Grover'))
+        import GroverAlgo
+    return GroverAlgo
 
 def generate_histogram():
-    # 1. Create a dummy maneuver file if it doesn't exist or just to be sure we have good data
+    GroverAlgo = _import_grover()
+
+    # 1. Known-good maneuver data, handed to Grover in memory in array form
     dummy_data = {
-        "maneuvers": [
-            {"id": 0, "score": 0.25, "validity": True},
-            {"id": 1, "score": 0.45, "validity": True},
-            {"id": 2, "score": 0.30, "validity": True},
-            {"id": 3, "score": 0.10, "validity": True},
-            {"id": 4, "score": 0.85, "validity": True}, # Target
-            {"id": 5, "score": 0.20, "validity": True},
-            {"id": 6, "score": 0.15, "validity": True},
-            {"id": 7, "score": 0.35, "validity": True}
-        ]
+        "ids": np.arange(8, dtype=np.int32),
+        # Scores are only ranked, so float16 precision is plenty
+        "scores": np.array([0.25, 0.45, 0.30, 0.10, 0.85, 0.20, 0.15, 0.35], dtype=np.float16),  # Target: 4
+        "validity": np.ones(8, dtype=bool)
     }
     
-    demo_file = 'demo_maneuver_data.json'
-    with open(demo_file, 'w') as f:
-        json.dump(dummy_data, f)
-        
-    print(f"Created temporary file: {demo_file}")
-    
-    # 2. Run Grover Algo
-    print("Running Quantum Search...")
-    result = GroverAlgo.run_quantum_maneuver_search(demo_file, return_image=True)
+    # 2. Run Grover Algo (skipped when this input was already rendered)
+    logger.info("Running Quantum Search...")
+    png = _cached_histogram(_input_key(dummy_data))
     
-    if result and 'plot_image' in result:
-        # 3. Decode and save image
-        data_uri = result['plot_image']
-        # Remove header "data:image/png;base64,"
-        base64_data = data_uri.split(',')[1]
-        
-        output_file = 'quantum_histogram.png'
-        with open(output_file, 'wb') as f:
-            f.write(base64.decodebytes(base64_data.encode()))
-            
-        print(f"Success! Histogram saved to: {os.path.abspath(output_file)}")
+    if png:
+        GroverAlgo.write_png(OUTPUT_FILE, png)
+        logger.info("Success! Histogram saved to: %s", OUTPUT_FILE)
     else:
-        print("Failed to generate histogram.")
+        logger.error("Failed to generate histogram.")
+
+def _input_key(data):
+    """
+    Hashable, exact stand-in for a maneuver input: its sort_keys JSON dump,
+    or (name, dtype, raw bytes) per column for the array form.
+    """
+    if 'ids' in data:
+        return tuple((name, col.dtype.str, col.tobytes()) for name, col in sorted(data.items()))
+    return json.dumps(data, sort_keys=True)
+
+@lru_cache(maxsize=16)
+def _cached_histogram(key):
+    """
+    Histogram PNG bytes for a maneuver input given by its _input_key, or
+    None if it has no valid maneuver. Repeat inputs in the same process
+    skip the simulation and rendering.
+    """
+    if isinstance(key, str):
+        data = json.loads(key)
+    else:
+        data = {name: np.frombuffer(buf, dtype=dtype) for name, dtype, buf in key}
+    result = _import_grover().run_quantum_maneuver_search(data, return_image='bytes')
+    return result["plot_image_bytes"] if result else None
+
+def generate_histograms(inputs, output_dir, workers=1):
+    """
+    Batch form of generate_histogram for many maneuver inputs, each either
+    {"maneuvers": [...]} or in array form.
+    All searches go to the simulator as one job (Grover circuits are cached
+    per target, so repeat targets skip transpilation) and each histogram is
+    written to output_dir/quantum_histogram_<k>.png. Returns the paths in
+    input order, None where an input has no valid maneuver.
+
+    With workers > 1 (None: half the CPUs) the inputs are split into that
+    many contiguous chunks, each run as its own batch in a worker process.
+    Workers are spawned, not forked (forking after Aer's OpenMP runtime is
+    up can deadlock), so callers need the usual __main__ guard.
+    """
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 2) // 2)
+    workers = min(workers, len(inputs))
+
+    os.makedirs(output_dir, exist_ok=True)
+    logger.info("Running Quantum Search over %d inputs...", len(inputs))
+    if workers <= 1:
+        paths = _histogram_chunk(inputs, output_dir, 0)
+    else:
+        size = -(-len(inputs) // workers)
+        starts = range(0, len(inputs), size)
+        # Each process already owns a core; keep OpenMP/BLAS from starting
+        # more threads. Spawned workers copy the environment when they start
+        # (before unpickling imports numpy), so it is set here, not in them.
+        saved = os.environ.get('OMP_NUM_THREADS')
+        os.environ['OMP_NUM_THREADS'] = '1'
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as pool:
+                chunks = pool.map(_histogram_chunk, [inputs[i:i + size] for i in starts],
+                                  [output_dir] * len(starts), starts)
+                paths = [path for chunk in chunks for path in chunk]
+        finally:
+            if saved is None:
+                del os.environ['OMP_NUM_THREADS']
+            else:
+                os.environ['OMP_NUM_THREADS'] = saved
+    logger.info("Saved %d histograms to: %s", sum(p is not None for p in paths), output_dir)
+    return paths
+
+def _histogram_chunk(inputs, output_dir, start):
+    """One simulator job for inputs, saved as quantum_histogram_<start + k>.png."""
+    GroverAlgo = _import_grover()
+
+    results = GroverAlgo.run_quantum_maneuver_search_batch(
+        [GroverAlgo.maneuvers_of(data) for data in inputs], include_counts=True)
 
-    # Cleanup
-    if os.path.exists(demo_file):
-        os.remove(demo_file)
+    paths = []
+    for k, result in enumerate(results, start):
+        if result is None:
+            logger.warning("Input %d: no valid maneuver, no histogram.", k)
+            paths.append(None)
+            continue
+        path = os.path.join(output_dir, f'quantum_histogram_{k}.png')
+        paths.append(GroverAlgo.render_histogram_png(result["counts"], path))
+    return paths
 
 if __name__ == "__main__":
+    # Only this script's messages; root-level INFO would pick up Qiskit's
+    # per-pass transpiler logging
+    logger.addHandler(logging.StreamHandler())
+    logger.setLevel(logging.INFO)
     generate_histogram()